@@ -0,0 +1,233 @@
+'''
+A local stand-in for the parts of the Steam API that Steamfront uses, for running benchmarks without touching the network.
+
+The server acts as an HTTP proxy, so a client only needs its session pointed at it - every URL stays exactly as it would be against Steam.
+Responses are shaped like real ones, and the server can be told to add latency and to throttle a share of requests with HTTP 429.
+'''
+
+from json import dumps as _dumps
+from random import Random as _Random
+from threading import Lock as _Lock
+from threading import Thread as _Thread
+from time import sleep as _sleep
+from http.server import BaseHTTPRequestHandler as _BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer as _ThreadingHTTPServer
+from urllib.parse import parse_qsl as _parse_qsl
+from urllib.parse import urlsplit as _urlsplit
+
+
+_words = (
+    'Age', 'Arena', 'Battle', 'Blade', 'Chronicles', 'City', 'Craft', 'Dark', 'Dawn', 'Dead', 'Dragon', 'Dream', 'Dungeon', 'Empire',
+    'Escape', 'Farm', 'Force', 'Galaxy', 'Ghost', 'Hero', 'Island', 'Kingdom', 'Knight', 'Legend', 'Light', 'Lost', 'Magic', 'Night',
+    'Ocean', 'Quest', 'Racing', 'Rise', 'Road', 'Shadow', 'Simulator', 'Souls', 'Space', 'Star', 'Storm', 'Tactics', 'Tales', 'Tower',
+    'War', 'World', 'Zero',
+)
+
+
+def appName(appid: int) -> str:
+    '''
+    Gives the made up name of an app, which is the same every time for the same ID.
+    '''
+
+    random = _Random(appid)
+    words = ' '.join(random.choice(_words) for _ in range(random.randint(1, 4)))
+    return words if random.random() < 0.6 else '{} {}'.format(words, random.randint(2, 9))
+
+
+def appDetails(appid: int) -> dict:
+    '''
+    Gives an appdetails entry for an app, with the same fields and roughly the same size as a real one.
+    '''
+
+    random = _Random(appid)
+    description = '<p>' + ' '.join(random.choice(_words).lower() for _ in range(400)) + '</p>'
+    requirements = {'minimum': '<strong>Minimum:</strong><br><ul><li>OS: Windows 10</li><li>Memory: 8 GB RAM</li></ul>'}
+    initial = random.choice((499, 999, 1499, 1999, 2999, 5999))
+    discount = random.choice((0, 0, 0, 10, 25, 50, 75))
+    return {
+        'success': True,
+        'data': {
+            'type': 'game',
+            'name': appName(appid),
+            'steam_appid': appid,
+            'required_age': random.choice((0, 0, 13, 18)),
+            'is_free': False,
+            'controller_support': 'full',
+            'detailed_description': description,
+            'about_the_game': description,
+            'short_description': description[:300],
+            'supported_languages': 'English, French, German, Spanish - Spain, Japanese',
+            'header_image': 'https://cdn.akamai.steamstatic.com/steam/apps/{}/header.jpg'.format(appid),
+            'website': None,
+            'pc_requirements': requirements,
+            'mac_requirements': requirements,
+            'linux_requirements': requirements,
+            'developers': ['Studio {}'.format(appid % 997)],
+            'publishers': ['Publisher {}'.format(appid % 211)],
+            'price_overview': {
+                'currency': 'USD',
+                'initial': initial,
+                'final': initial * (100 - discount) // 100,
+                'discount_percent': discount,
+                'initial_formatted': '',
+                'final_formatted': '',
+            },
+            'platforms': {'windows': True, 'mac': random.random() < 0.3, 'linux': random.random() < 0.2},
+            'metacritic': {'score': random.randint(40, 95), 'url': 'https://www.metacritic.com/game/pc/'},
+            'categories': [{'id': i, 'description': 'Category {}'.format(i)} for i in random.sample(range(1, 60), 5)],
+            'genres': [{'id': str(i), 'description': 'Genre {}'.format(i)} for i in random.sample(range(1, 30), 3)],
+            'screenshots': [{'id': i, 'path_thumbnail': 'thumb.jpg', 'path_full': 'full.jpg'} for i in range(10)],
+            'recommendations': {'total': random.randint(0, 100000)},
+            'release_date': {'coming_soon': False, 'date': '1 Jan, 2017'},
+            'support_info': {'url': '', 'email': 'support@example.com'},
+            'background': 'https://cdn.akamai.steamstatic.com/steam/apps/{}/page_bg_generated_v6b.jpg'.format(appid),
+        },
+    }
+
+
+def playerSummary(id64: str) -> dict:
+    '''
+    Gives the player summary of a made up user.
+    '''
+
+    return {
+        'steamid': id64,
+        'communityvisibilitystate': 3,
+        'profilestate': 1,
+        'personaname': 'Player {}'.format(id64[-6:]),
+        'lastlogoff': 1500000000,
+        'profileurl': 'https://steamcommunity.com/profiles/{}/'.format(id64),
+        'avatar': 'avatar.jpg',
+        'avatarmedium': 'avatar_medium.jpg',
+        'avatarfull': 'avatar_full.jpg',
+        'personastate': 1,
+    }
+
+
+class FakeSteam(object):
+    '''
+    The server, which runs on a background thread once started.
+
+    :param int appCount: How many apps are in the app list.
+    :param int gamesPerUser: How many games each user owns.
+    :param float latency: How long, in seconds, each response is held back for.
+    :param float jitter: The most extra time, in seconds, added at random to each response.
+    :param float throttle: The share of requests, from `0` to `1`, that are answered with HTTP 429.
+    :param int seed: The seed for the random choices the server makes.
+    '''
+
+    def __init__(self, *, appCount: int=150000, gamesPerUser: int=200, latency: float=0.0, jitter: float=0.0, throttle: float=0.0, seed: int=0):
+
+        self.appCount = appCount
+        self.gamesPerUser = gamesPerUser
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle = throttle
+        self.requests = 0
+        self._lock = _Lock()
+        self._random = _Random(seed)
+        self._server = None
+
+        # The app list is made once up front, since it's so large
+        apps = [{'appid': i * 10, 'name': appName(i * 10)} for i in range(1, appCount + 1)]
+        self.appList = _dumps({'applist': {'apps': {'app': apps}}}).encode('utf-8')
+
+    @property
+    def url(self) -> str:
+        '''
+        The URL of the server, to be used as an HTTP proxy.
+        '''
+
+        host, port = self._server.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def start(self):
+        '''
+        Starts the server on a free port.
+        '''
+
+        fake = self
+
+        class Handler(_BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                status, body = fake.respond(self.path)
+                self.send_response(status)
+                if status == 429:
+                    self.send_header('Retry-After', '0')
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        _Thread(target=self._server.serve_forever, name='fakesteam', daemon=True).start()
+        return self
+
+    def stop(self):
+        '''
+        Stops the server.
+        '''
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, url: str) -> tuple:
+        '''
+        Gives the status code and body for a request.
+        '''
+
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+            throttled = self.throttle and self._random.random() < self.throttle
+        if delay:
+            _sleep(delay)
+        if throttled:
+            return 429, b'null'
+
+        parts = _urlsplit(url)
+        query = dict(_parse_qsl(parts.query))
+        path = parts.path
+
+        if path.endswith('/GetAppList/v0001/'):
+            return 200, self.appList
+
+        if path.endswith('/api/appdetails'):
+            appids = query.get('appids', '').split(',')
+            if len(appids) > 1 and query.get('filters') != 'price_overview':
+                return 400, b'null'
+            output = {}
+            for appid in appids:
+                number = int(appid) if appid.isdigit() else 0
+                if not number or number % 10 or number > self.appCount * 10:
+                    output[appid] = {'success': False}
+                elif query.get('filters') == 'price_overview':
+                    output[appid] = {'success': True, 'data': {'price_overview': appDetails(number)['data']['price_overview']}}
+                else:
+                    output[appid] = appDetails(number)
+            return 200, _dumps(output).encode('utf-8')
+
+        if path.endswith('/GetPlayerSummaries/v0002/'):
+            players = [playerSummary(i) for i in query.get('steamids', '').split(',') if i.isdigit()]
+            return 200, _dumps({'response': {'players': players}}).encode('utf-8')
+
+        if path.endswith('/GetOwnedGames/v0001/'):
+            random = _Random(query.get('steamid'))
+            appids = random.sample(range(1, self.appCount + 1), min(self.gamesPerUser, self.appCount))
+            games = [{'appid': i * 10, 'playtime_forever': random.randint(0, 5000)} for i in appids]
+            return 200, _dumps({'response': {'game_count': len(games), 'games': games}}).encode('utf-8')
+
+        if path.endswith('/ResolveVanityURL/v0001/'):
+            name = query.get('vanityurl', '')
+            if name.startswith('missing'):
+                return 200, _dumps({'response': {'success': 42, 'message': 'No match'}}).encode('utf-8')
+            return 200, _dumps({'response': {'steamid': str(76561197960265728 + sum(map(ord, name))), 'success': 1}}).encode('utf-8')
+
+        return 404, b'null'
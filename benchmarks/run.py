@@ -0,0 +1,149 @@
+'''
+Runs Steamfront's benchmarks against a local stand-in for the Steam API, and prints how fast each one went.
+
+    python benchmarks/run.py --latency 0.02 --throttle 0.01 --json results.json
+
+Results saved with `--json` can be compared between releases.
+'''
+
+from argparse import ArgumentParser as _ArgumentParser
+from json import dump as _dump
+from os.path import abspath as _abspath
+from os.path import dirname as _dirname
+from platform import python_version as _python_version
+from sys import path as _path
+from time import perf_counter as _perf_counter
+
+_path.insert(0, _dirname(_dirname(_abspath(__file__))))
+_path.insert(0, _dirname(_abspath(__file__)))
+
+import steamfront
+from steamfront.app import App
+from steamfront.transport import Transport
+from fakesteam import FakeSteam, appDetails
+
+
+def makeClient(fake: FakeSteam, **kwargs) -> steamfront.Client:
+    '''
+    Makes a client whose requests all go to the fake server.
+    '''
+
+    transport = Transport(rateLimits={}, backoff=0.01, poolSize=64)
+    transport.session.proxies = {'http': fake.url}
+    return steamfront.Client('benchmark', transport=transport, **kwargs)
+
+
+def timed(function, count: int) -> tuple:
+    '''
+    Runs a function, giving back how long it took and how many operations a second that was.
+    '''
+
+    start = _perf_counter()
+    function()
+    seconds = _perf_counter() - start
+    return seconds, count / seconds if seconds else float('inf')
+
+
+def benchmarks(fake: FakeSteam, options) -> list:
+    '''
+    Gives each benchmark as a tuple of its name, how many operations it does, and the function that does them.
+    '''
+
+    appids = [i * 10 for i in range(1, options.apps + 1)]
+    id64s = [str(76561197960265728 + i) for i in range(options.users)]
+    payloads = [appDetails(i) for i in appids]
+
+    def construct():
+        for i in payloads:
+            App.fromPayload(i).name
+
+    def singleApps():
+        client = makeClient(fake)
+        for i in appids[:options.single]:
+            client.getApp(appid=i)
+
+    def bulkApps():
+        makeClient(fake).getApps(appids, concurrency=options.concurrency)
+
+    def prices():
+        makeClient(fake).getPrices(appids)
+
+    def coldName():
+        makeClient(fake).getApp(name=fakeNames[0])
+
+    client = makeClient(fake)
+    client._loadAppList()
+    fakeNames = [client._appList.nameAt(i) for i in range(0, len(client._appList), max(1, len(client._appList) // 1000))]
+
+    def warmNames():
+        for i in fakeNames:
+            client._getIDOfApp(i)
+            client._getIDOfApp(i.upper(), caseSensitive=False)
+
+    def search():
+        for i in fakeNames[:100]:
+            client.searchApps(i[:-1])
+
+    def singleUsers():
+        client = makeClient(fake)
+        for i in id64s[:options.single]:
+            client.getUser(id64=i)
+
+    def bulkUsers():
+        makeClient(fake).getUsers(id64s, concurrency=options.concurrency)
+
+    def hydrate():
+        user = makeClient(fake).getUser(id64=id64s[0])
+        user.loadApps(concurrency=options.concurrency)
+
+    return [
+        ('App.fromPayload (no I/O)', len(payloads), construct),
+        ('getApp, one at a time', options.single, singleApps),
+        ('getApps, bulk', len(appids), bulkApps),
+        ('getPrices, bulk', len(appids), prices),
+        ('Name lookup, cold (app list download)', 1, coldName),
+        ('Name lookup, warm', len(fakeNames) * 2, warmNames),
+        ('searchApps', 100, search),
+        ('getUser, one at a time', options.single, singleUsers),
+        ('getUsers, bulk', len(id64s), bulkUsers),
+        ('User.loadApps (library hydration)', fake.gamesPerUser, hydrate),
+    ]
+
+
+def main():
+    parser = _ArgumentParser(description='Benchmark Steamfront against a local stand-in for the Steam API.')
+    parser.add_argument('--app-list', type=int, default=150000, help='how many apps are in the app list')
+    parser.add_argument('--apps', type=int, default=1000, help='how many apps the bulk benchmarks get')
+    parser.add_argument('--users', type=int, default=500, help='how many users the bulk benchmarks get')
+    parser.add_argument('--games', type=int, default=200, help='how many games each user owns')
+    parser.add_argument('--single', type=int, default=100, help='how many lookups the one at a time benchmarks do')
+    parser.add_argument('--concurrency', type=int, default=16, help='how many requests the bulk benchmarks have running at once')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='most seconds added at random to every response')
+    parser.add_argument('--throttle', type=float, default=0.0, help='share of requests answered with HTTP 429')
+    parser.add_argument('--only', action='append', help='only run benchmarks whose names contain this')
+    parser.add_argument('--json', help='file to save the results to')
+    options = parser.parse_args()
+
+    fake = FakeSteam(appCount=options.app_list, gamesPerUser=options.games, latency=options.latency, jitter=options.jitter, throttle=options.throttle).start()
+    results = []
+    try:
+        print('{:<40} {:>10} {:>10} {:>12} {:>10}'.format('Benchmark', 'Operations', 'Seconds', 'Per second', 'Requests'))
+        for name, count, function in benchmarks(fake, options):
+            if options.only and not any(i.lower() in name.lower() for i in options.only):
+                continue
+            before = fake.requests
+            seconds, rate = timed(function, count)
+            requests = fake.requests - before
+            print('{:<40} {:>10} {:>10.3f} {:>12.1f} {:>10}'.format(name, count, seconds, rate, requests))
+            results.append({'name': name, 'operations': count, 'seconds': seconds, 'per_second': rate, 'requests': requests})
+    finally:
+        fake.stop()
+
+    if options.json:
+        with open(options.json, 'w') as a:
+            _dump({'version': steamfront.__version__, 'python': _python_version(), 'options': vars(options), 'results': results}, a, indent=4)
+
+
+if __name__ == '__main__':
+    main()
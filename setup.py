@@ -25,10 +25,17 @@ setup(
         'Topic :: Internet',
         'Topic :: Utilities',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 2',
         'Programming Language :: Python :: 3'
     ],
+    python_requires='>=3.9',
     install_requires=['requests'],
-    packages=find_packages()
+    extras_require={
+        'async': ['aiohttp'],
+        'export': ['pyarrow']
+    },
+    packages=find_packages(),
+    entry_points={
+        'console_scripts': ['steamfront=steamfront.cli:main']
+    }
 )
 
@@ -0,0 +1,6 @@
+from sys import exit as _exit
+from .cli import main
+
+
+if __name__ == '__main__':
+    _exit(main())
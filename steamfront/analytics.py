@@ -0,0 +1,349 @@
+from array import array as _array
+from collections import Counter as _Counter
+from collections import namedtuple as _namedtuple
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from heapq import nlargest as _nlargest
+
+
+PlaytimeStats = _namedtuple('PlaytimeStats', 'count total mean quantiles')
+PlaytimeStats.__doc__ = '''
+How much an app has been played, from :meth:`steamfront.analytics.LibraryMatrix.playtimeDistribution`.
+`count` is the number of owners looked at, `total` and `mean` are in minutes, and `quantiles` is a `dict` of each quantile asked for to its playtime in minutes.
+'''
+
+
+class LibraryMatrix(object):
+    '''
+    The games owned by many users, packed into a sparse matrix with a row for each user and a column for each app, holding the user's playtime of that app.
+    Rows are kept in compressed sparse row form, and a compressed sparse column copy is made the first time something needs to look down an app's column.
+    Only app IDs and playtimes are kept, so apps never need to be unlazified, and tens of thousands of users fit in a few hundred megabytes at most.
+
+    Should not be made directly - use :meth:`fromOwnedGames`, :meth:`fromUsers`, or :meth:`fetch`.
+
+    :ivar id64s: A `list` of the ID64 of each user, in row order.
+    :ivar appids: An `array` of the ID of each app, in column order.
+    :ivar failed: A `dict` of ID64 to the exception raised when getting that user's games, for matrices made with :meth:`fetch`.
+    '''
+
+    def __init__(self, id64s: list, appids: _array, rowStart: _array, columns: _array, playtimes: _array):
+
+        self.id64s = id64s
+        self.appids = appids
+        self.failed = {}
+        self._rowStart = rowStart
+        self._columns = columns
+        self._playtimes = playtimes
+        self._rowOf = {id64: row for row, id64 in enumerate(id64s)}
+        self._columnOf = {appid: column for column, appid in enumerate(appids)}
+        self._columnStart = None
+        self._rows = None
+        self._columnPlaytimes = None
+
+    @classmethod
+    def fromOwnedGames(cls, libraries):
+        '''
+        Makes a matrix from owned games that have already been retrieved from the API.
+
+        :param libraries: Each user's ID64 paired with either the `response` of a GetOwnedGames request for them, or a list of their games. Can be a `dict` or an iterable of pairs, and is only gone through once.
+        :type libraries: Union[dict, Iterable[tuple]]
+        :rtype: :class:`steamfront.analytics.LibraryMatrix`
+        '''
+
+        if isinstance(libraries, dict):
+            libraries = libraries.items()
+
+        id64s = []
+        columnOf = {}
+        rowStart = _array('Q', [0])
+        columns = _array('I')
+        playtimes = _array('I')
+
+        for id64, games in libraries:
+            if isinstance(games, dict):
+                games = games.get('games', ())
+
+            # A game listed twice only counts once
+            row = {}
+            for game in games or ():
+                row[int(game['appid'])] = game.get('playtime_forever', 0)
+            for appid, playtime in row.items():
+                column = columnOf.get(appid)
+                if column is None:
+                    column = columnOf[appid] = len(columnOf)
+                columns.append(column)
+                playtimes.append(playtime)
+
+            id64s.append(str(id64))
+            rowStart.append(len(columns))
+
+        return cls(id64s, _array('I', columnOf), rowStart, columns, playtimes)
+
+    @classmethod
+    def fromUsers(cls, users):
+        '''
+        Makes a matrix from users that were got along with their apps. Users got without their apps are given an empty row.
+
+        :param users: The users.
+        :type users: Iterable[steamfront.user.User]
+        :rtype: :class:`steamfront.analytics.LibraryMatrix`
+        '''
+
+        return cls.fromOwnedGames((i.id64, i.raw_apps) for i in users)
+
+    @classmethod
+    def fetch(cls, client, id64s, *, concurrency: int=8):
+        '''
+        Gets the owned games of many users through a client and makes a matrix from them, without getting the users' summaries or making any objects for them.
+        Users whose games couldn't be got are left out, and their exceptions are put into :attr:`failed`.
+
+        :param steamfront.client.Client client: The client to get the games through.
+        :param id64s: The ID64s of the users.
+        :type id64s: Iterable[str]
+        :param int concurrency: The most requests to have running at once.
+        :rtype: :class:`steamfront.analytics.LibraryMatrix`
+        :raises steamfront.errors.APIKeyRequired: An API key is needed to get user information from Steam.
+        '''
+
+        client._checkAPIKey()
+
+        # Remove duplicates while keeping order
+        id64s = list(dict.fromkeys(str(i) for i in id64s))
+        failed = {}
+
+        def getGames(id64):
+            try:
+                return id64, client._getOwnedGames(id64)
+            except Exception as e:
+                failed[id64] = e
+                return id64, None
+
+        with _ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            matrix = cls.fromOwnedGames((id64, games) for id64, games in pool.map(getGames, id64s) if games is not None)
+        matrix.failed = failed
+        return matrix
+
+    def __len__(self):
+        return len(self.id64s)
+
+    @property
+    def shape(self) -> tuple:
+        '''
+        The number of users and the number of apps, as a tuple.
+        '''
+
+        return len(self.id64s), len(self.appids)
+
+    @property
+    def entries(self) -> int:
+        '''
+        The number of user and app pairs in the matrix.
+        '''
+
+        return len(self._columns)
+
+    def _row(self, id64) -> int:
+        row = self._rowOf.get(str(id64))
+        if row is None:
+            raise KeyError('The user `{}` is not in the matrix.'.format(id64))
+        return row
+
+    def _columnSet(self, id64) -> set:
+        row = self._row(id64)
+        return set(self._columns[self._rowStart[row]:self._rowStart[row + 1]])
+
+    def _buildColumns(self):
+        '''
+        Makes the compressed sparse column copy of the matrix.
+        '''
+
+        counts = _Counter(self._columns)
+        columnStart = _array('Q', [0])
+        for column in range(len(self.appids)):
+            columnStart.append(columnStart[-1] + counts[column])
+
+        # Fill each column in row order, so the rows within it end up sorted
+        fill = _array('Q', columnStart[:-1])
+        rows = _array('I', bytes(4 * len(self._columns)))
+        playtimes = _array('I', bytes(4 * len(self._columns)))
+        columns, rowPlaytimes, rowStart = self._columns, self._playtimes, self._rowStart
+        for row in range(len(self.id64s)):
+            for index in range(rowStart[row], rowStart[row + 1]):
+                column = columns[index]
+                position = fill[column]
+                fill[column] = position + 1
+                rows[position] = row
+                playtimes[position] = rowPlaytimes[index]
+
+        self._rows, self._columnPlaytimes = rows, playtimes
+        self._columnStart = columnStart
+
+    def _column(self, appid) -> tuple:
+        '''
+        Gives the start and end of an app's column, building the columns first if needed.
+        '''
+
+        if self._columnStart is None:
+            self._buildColumns()
+        column = self._columnOf.get(int(appid))
+        if column is None:
+            return 0, 0
+        return self._columnStart[column], self._columnStart[column + 1]
+
+    def games(self, id64) -> dict:
+        '''
+        Gives a user's games.
+
+        :param str id64: The user's ID64.
+        :return: A `dict` of app ID to the user's playtime of it in minutes.
+        :rtype: dict
+        :raises KeyError: Raised if the user isn't in the matrix.
+        '''
+
+        row = self._row(id64)
+        start, end = self._rowStart[row], self._rowStart[row + 1]
+        return {str(self.appids[c]): t for c, t in zip(self._columns[start:end], self._playtimes[start:end])}
+
+    def owners(self, appid) -> list:
+        '''
+        Gives the ID64s of the users who own an app.
+
+        :param str appid: The ID of the app.
+        :rtype: list
+        '''
+
+        start, end = self._column(appid)
+        return [self.id64s[i] for i in self._rows[start:end]]
+
+    def sharedGames(self, *id64s) -> list:
+        '''
+        Gives the IDs of the apps that every one of the given users owns.
+
+        :param str id64s: The ID64s of two or more users.
+        :rtype: list
+        :raises KeyError: Raised if a user isn't in the matrix.
+        '''
+
+        if not id64s:
+            return []
+        shared = self._columnSet(id64s[0])
+        for id64 in id64s[1:]:
+            shared &= self._columnSet(id64)
+        return [str(self.appids[i]) for i in sorted(shared)]
+
+    def overlap(self, first, second) -> int:
+        '''
+        Gives how many apps two users both own.
+
+        :param str first: The ID64 of one user.
+        :param str second: The ID64 of the other user.
+        :rtype: int
+        :raises KeyError: Raised if a user isn't in the matrix.
+        '''
+
+        return len(self._columnSet(first) & self._columnSet(second))
+
+    def jaccard(self, first, second) -> float:
+        '''
+        Gives the Jaccard similarity of two users' libraries - the number of apps they both own over the number either of them owns.
+
+        :param str first: The ID64 of one user.
+        :param str second: The ID64 of the other user.
+        :return: A score from `0.0`, for no apps in common, to `1.0`, for the same apps. Two empty libraries score `0.0`.
+        :rtype: float
+        :raises KeyError: Raised if a user isn't in the matrix.
+        '''
+
+        a, b = self._columnSet(first), self._columnSet(second)
+        union = len(a | b)
+        return len(a & b) / union if union else 0.0
+
+    def similarUsers(self, id64, *, limit: int=10, minShared: int=1) -> list:
+        '''
+        Finds the users whose libraries are most like a user's, by Jaccard similarity.
+        Only the users who own at least one of the same apps are looked at, so this stays quick on large matrices.
+
+        :param str id64: The ID64 of the user.
+        :param int limit: The most users to give back.
+        :param int minShared: The fewest apps another user has to have in common to be given back.
+        :return: A `list` of `(id64, score, shared)` tuples, most similar first, where `shared` is the number of apps in common.
+        :rtype: list
+        :raises KeyError: Raised if the user isn't in the matrix.
+        '''
+
+        row = self._row(id64)
+        start, end = self._rowStart[row], self._rowStart[row + 1]
+        if self._columnStart is None:
+            self._buildColumns()
+
+        # Count the apps each other user has in common by going down each of this user's columns
+        counts = _Counter()
+        for column in self._columns[start:end]:
+            counts.update(self._rows[self._columnStart[column]:self._columnStart[column + 1]])
+        del counts[row]
+
+        size, rowStart = end - start, self._rowStart
+        scored = (
+            (self.id64s[other], shared / (size + rowStart[other + 1] - rowStart[other] - shared), shared)
+            for other, shared in counts.items() if shared >= minShared
+        )
+        return _nlargest(limit, scored, key=lambda i: (i[1], i[2]))
+
+    def topPlayed(self, *, limit: int=10, by: str='playtime', id64s=None) -> list:
+        '''
+        Finds the apps that a group of users have played the most, or that the most of them own.
+
+        :param int limit: The most apps to give back.
+        :param str by: Either `playtime`, to rank by total minutes played, or `owners`, to rank by how many users own the app.
+        :param id64s: The ID64s of the users to look at. Defaults to every user in the matrix.
+        :type id64s: Optional[Iterable[str]]
+        :return: A `list` of `(appid, playtime, owners)` tuples, top first, where `playtime` is the total in minutes.
+        :rtype: list
+        :raises KeyError: Raised if a user isn't in the matrix.
+        '''
+
+        if by not in ('playtime', 'owners'):
+            raise ValueError('Apps can only be ranked by `playtime` or `owners`.')
+
+        playtime, owners = _Counter(), _Counter()
+        if id64s is None:
+
+            # Every user is wanted, so each column can be summed in one go
+            if self._columnStart is None:
+                self._buildColumns()
+            columnStart, columnPlaytimes = self._columnStart, self._columnPlaytimes
+            for column in range(len(self.appids)):
+                start, end = columnStart[column], columnStart[column + 1]
+                owners[column] = end - start
+                playtime[column] = sum(columnPlaytimes[start:end])
+        else:
+            for id64 in dict.fromkeys(str(i) for i in id64s):
+                row = self._row(id64)
+                start, end = self._rowStart[row], self._rowStart[row + 1]
+                owners.update(self._columns[start:end])
+                for column, minutes in zip(self._columns[start:end], self._playtimes[start:end]):
+                    playtime[column] += minutes
+
+        first, second = (playtime, owners) if by == 'playtime' else (owners, playtime)
+        top = _nlargest(limit, owners, key=lambda i: (first[i], second[i]))
+        return [(str(self.appids[i]), playtime[i], owners[i]) for i in top]
+
+    def playtimeDistribution(self, appid, *, quantiles: tuple=(0.25, 0.5, 0.75, 0.9, 0.99), includeUnplayed: bool=True) -> PlaytimeStats:
+        '''
+        Gives how much the owners of an app have played it.
+
+        :param str appid: The ID of the app.
+        :param tuple quantiles: The quantiles to work out, each from `0` to `1`.
+        :param bool includeUnplayed: Whether owners who have never played the app are counted.
+        :rtype: :class:`steamfront.analytics.PlaytimeStats`
+        '''
+
+        start, end = self._column(appid)
+        values = sorted(self._columnPlaytimes[start:end]) if end > start else []
+        if not includeUnplayed:
+            values = [i for i in values if i]
+
+        count, total = len(values), sum(values)
+        output = {}
+        for quantile in quantiles:
+            output[quantile] = values[min(count - 1, int(quantile * count))] if count else None
+        return PlaytimeStats(count, total, total / count if count else None, output)
@@ -1,7 +1,63 @@
-from requests import get as _get
+from .transport import Transport as _Transport
 from .errors import AppNotFound as _AppNotFound
 
 
+class _Field(object):
+    '''
+    An attribute of an app that's only worked out from the app's raw data the first time it's asked for, and then remembered.
+    '''
+
+    __slots__ = ('name', 'value', 'second', 'error', 'iterate', 'listed')
+
+    def __init__(self, value: str, *, second: str=None, error='NOPE', iterate: str=None, listed: bool=False):
+
+        self.value = value
+        self.second = second
+        self.error = error
+        self.iterate = iterate
+        self.listed = listed
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        fields = instance._fields
+        try:
+            return fields[self.name]
+        except KeyError:
+            pass
+        fields[self.name] = value = self.decode(instance.raw)
+        return value
+
+    def __set__(self, instance, value):
+        instance._fields[self.name] = value
+
+    def decode(self, data: dict):
+        '''
+        Gets the value out of the app's raw data.
+        '''
+
+        if self.iterate == None:
+            try:
+                if self.second is not None:
+                    return data[self.value][self.second]
+                else:
+                    return data[self.value]
+            except Exception as e:
+                return e if self.error == 'NOPE' else self.error
+        else:
+            try:
+                if self.listed == False:
+                    return [i[self.iterate] for i in data[self.value]]
+                else:
+                    return [i[self.iterate] for i in data[self.value][0]]
+            except Exception as e:
+                return e if self.error == 'NOPE' else self.error
+
+
 class App(object):
     '''
     The app object, providing information on apps on the Steam store.
@@ -10,7 +66,10 @@ class App(object):
         It should be noted that not all of these attributes will be available for every app, but all will be present. 
         Make sure that the attributes you want to use do not contain exceptions or `None`.
 
+    Attributes are worked out from :attr:`raw` the first time they're used, so making an app only costs as much as the attributes you look at.
+
     :param str appid: The ID of an app.
+    :param transport: The :class:`steamfront.transport.Transport` to get the app through. A shared default one is used if none is given.
     :ivar raw: The raw return of values from Steam.
     :ivar about_the_game: A `str` containing the 'about the game' section from the Steam store page.
     :ivar appid: A `str` containing the ID of the app.
@@ -39,78 +98,85 @@ class App(object):
     :ivar supported_languages: A `str` of comma seperated languages.
     :ivar type: A `str` pf the type of app that it is.
     :ivar website: The linked website of the app as a `str`.
+    :cvar FIELDS: A `tuple` of the names of all of the attributes above that are worked out from the raw data, in alphabetical order.
     :raises steamfront.errors.AppNotFound: Raised if the app provided can't be found.
     '''
 
+    __slots__ = ('raw', '_fields', '__weakref__')
+
     getGame = 'http://store.steampowered.com/api/appdetails?appids={}&format=json'
 
-    def __init__(self, appid: str):
+    # Each attribute is only worked out from the raw data when it's first used
+    about_the_game = _Field('about_the_game', error=None)
+    appid = _Field('steam_appid')
+    background = _Field('background')
+    categories = _Field('categories', iterate='description')
+    controller_support = _Field('controller_support', error=None)
+    detailed_description = _Field('detailed_description', error=None)
+    genres = _Field('genres', iterate='description')
+    developers = _Field('developers')
+    header_image = _Field('header_image')
+    is_free = _Field('is_free')
+    linux_requirements = _Field('linux_requirements', error=None)
+    mac_requirements = _Field('linux_requirements', error=None)
+    metacritic = _Field('metacritic')
+    name = _Field('name')
+    pc_requirements = _Field('pc_requirements', error=None)
+    platforms = _Field('platforms')
+    price_overview = _Field('price_overview', error=None)
+    publishers = _Field('publishers')
+    recommendations = _Field('recommendations', iterate='total')
+    release_date = _Field('release_date', second='date', error=None)
+    released = _Field('release_date', second='coming_soon')
+    required_age = _Field('required_age')
+    reviews = _Field('reviews')
+    screenshots = _Field('screenshots', iterate='path_full', listed=True)
+    short_description = _Field('short_description', error=None)
+    support_info = _Field('support_info')
+    supported_languages = _Field('supported_languages')
+    type = _Field('type')
+    website = _Field('website', error=None)
+    # packages = _Field('packages')
+    # movies = DOESNT FIT NICELY INTO GETVALUE
+    # package_groups = I don't actually know what this is
+    # legal_notice = Not relevant tbh
+    # achievements = Can't get all so won't get any
+
+    # The names of all of the attributes above, for going through an app's data without knowing it
+    FIELDS = tuple(sorted(name for name, value in locals().items() if isinstance(value, _Field)))
+
+    def __init__(self, appid: str, *, transport: _Transport=None):
 
         # Get the site page
         appid = str(appid)
         sitestr = App.getGame.format(appid)
-        site = _get(sitestr)
-        rawdata = site.json()
-        appdata = rawdata[appid]
+        rawdata = (transport or _Transport.default()).getJSON(sitestr)
+        self._load(rawdata.get(appid) if isinstance(rawdata, dict) else None)
+
+    @classmethod
+    def fromPayload(cls, payload: dict):
+        '''
+        Makes an app object from data that's already been retrieved from the API, without making any requests.
+
+        :param dict payload: The app's entry in an appdetails response - the `dict` with the keys `success` and `data`.
+        :return: The object of relevant data on the app.
+        :rtype: :class:`steamfront.app.App`
+        :raises steamfront.errors.AppNotFound: Raised if the payload says the app wasn't found.
+        '''
+
+        app = cls.__new__(cls)
+        app._load(payload)
+        return app
+
+    def _load(self, appdata: dict):
+        '''
+        Stores the attributes of the app from its entry in an appdetails response.
+        '''
 
         # Sees if you sucessfully got the data or not
-        if not appdata['success']:
+        if not appdata or not appdata['success']:
             raise _AppNotFound('The given app ID was not found.')
 
-        # Internal command for getting new values
-        def getvalue(value: str, *, second: str=None, error='NOPE', iterate: str=None, listed: bool=False):
-            if iterate == None:
-                try:
-                    if second is not None:
-                        return appdata['data'][value][second]
-                    else:
-                        return appdata['data'][value]
-                except Exception as e:
-                    return e if error == 'NOPE' else error
-            else:
-                try:
-                    if listed == False:
-                        return [i[iterate] for i in appdata['data'][value]]
-                    else:
-                        return [i[iterate] for i in appdata['data'][value][0]]
-                except Exception as e:
-                    return e if error == 'NOPE' else error
-
-        # Game page found, now store the relevant data in attributes
+        # Game page found, now store the data the attributes are worked out from
         self.raw = appdata['data']
-
-        self.about_the_game = getvalue('about_the_game', error=None)
-        self.appid = getvalue('steam_appid')
-        self.background = getvalue('background')
-        self.categories = getvalue('categories', iterate='description')
-        self.controller_support = getvalue('controller_support', error=None)
-        self.detailed_description = getvalue('detailed_description', error=None)
-        self.genres = getvalue('genres', iterate='description')
-        self.developers = getvalue('developers')
-        self.header_image = getvalue('header_image')
-        self.is_free = getvalue('is_free')
-        self.linux_requirements = getvalue('linux_requirements', error=None)
-        self.mac_requirements = getvalue('linux_requirements', error=None)
-        self.metacritic = getvalue('metacritic')
-        self.name = getvalue('name')
-        self.pc_requirements = getvalue('pc_requirements', error=None)
-        self.platforms = getvalue('platforms')
-        self.price_overview = getvalue('price_overview', error=None)
-        self.publishers = getvalue('publishers')
-        self.recommendations = getvalue('recommendations', iterate='total')
-        self.release_date = getvalue('release_date', second='date', error=None)
-        self.released = getvalue('release_date', second='coming_soon')
-        self.required_age = getvalue('required_age')
-        self.reviews = getvalue('reviews')
-        self.screenshots = getvalue('screenshots', iterate='path_full', listed=True)
-        self.short_description = getvalue('short_description', error=None)
-        self.support_info = getvalue('support_info')
-        self.supported_languages = getvalue('supported_languages')
-        self.type = getvalue('type')
-        self.website = getvalue('website', error=None)
-        # self.packages = getvalue('packages')
-        # self.movies = DOESNT FIT NICELY INTO GETVALUE
-        # self.package_groups = I don't actually know what this is
-        # self.legal_notice = Not relevant tbh
-        # self.achievements = Can't get all so won't get any
-        
+        self._fields = {}
@@ -0,0 +1,198 @@
+from array import array as _array
+from bisect import bisect_left as _bisect_left
+from hashlib import blake2b as _blake2b
+from mmap import mmap as _mmap
+from mmap import ACCESS_READ as _ACCESS_READ
+from os import makedirs as _makedirs
+from os import replace as _replace
+from os import unlink as _unlink
+from os.path import abspath as _abspath
+from os.path import dirname as _dirname
+from struct import Struct as _Struct
+from tempfile import NamedTemporaryFile as _NamedTemporaryFile
+
+
+def _hashName(name: str) -> int:
+    '''
+    Gives a 64 bit hash of a name that's the same in every process, so hashes can be kept on disk.
+    '''
+
+    return int.from_bytes(_blake2b(name.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class AppList(object):
+    '''
+    A compact list of every app on Steam, keeping app IDs in an integer array and all of the names packed into one block of UTF-8.
+    Apps can be looked up by ID or by name straight from these arrays, without making an object for each app.
+
+    Lists saved with :meth:`save` can be opened with :meth:`load`, which maps the file into memory so that every process using it shares the same pages.
+
+    Where multiple apps share the same name, the one which appears first in the list is given back, mirroring the order that Steam gives.
+    Should not be made manually - will be automatically generated by a :class:`steamfront.client.Client` instance.
+    '''
+
+    _header = _Struct('=4sIII')
+    _magic = b'SFAL'
+    _version = 1
+
+    def __init__(self, appids, offsets, blob, exactHashes, exactOrder, foldedHashes, foldedOrder, sortedIDs, idOrder):
+
+        self._appids = appids
+        self._offsets = offsets
+        self._blob = blob
+        self._exactHashes = exactHashes
+        self._exactOrder = exactOrder
+        self._foldedHashes = foldedHashes
+        self._foldedOrder = foldedOrder
+        self._sortedIDs = sortedIDs
+        self._idOrder = idOrder
+
+    @classmethod
+    def fromApps(cls, apps):
+        '''
+        Packs a list of apps.
+
+        :param apps: The app `dict`s, with keys `appid` and `name`, as given by the Steam API.
+        :type apps: Iterable[dict]
+        :rtype: :class:`steamfront.applist.AppList`
+        '''
+
+        appids = _array('I')
+        offsets = _array('I', [0])
+        blob = bytearray()
+        names = []
+        for i in apps:
+            appids.append(int(i['appid']))
+            names.append(i['name'])
+            blob += i['name'].encode('utf-8')
+            offsets.append(len(blob))
+
+        # Order everything that's searched by its key, keeping list order for equal keys
+        exactHashes = [_hashName(i) for i in names]
+        foldedHashes = [_hashName(i.casefold()) for i in names]
+        exactOrder = sorted(range(len(names)), key=exactHashes.__getitem__)
+        foldedOrder = sorted(range(len(names)), key=foldedHashes.__getitem__)
+        idOrder = sorted(range(len(names)), key=appids.__getitem__)
+
+        return cls(
+            appids, offsets, bytes(blob),
+            _array('Q', (exactHashes[i] for i in exactOrder)), _array('I', exactOrder),
+            _array('Q', (foldedHashes[i] for i in foldedOrder)), _array('I', foldedOrder),
+            _array('I', (appids[i] for i in idOrder)), _array('I', idOrder),
+        )
+
+    @classmethod
+    def load(cls, path: str):
+        '''
+        Opens a list saved with :meth:`save`, mapping it into memory rather than reading it.
+
+        :param str path: The path of the file.
+        :rtype: :class:`steamfront.applist.AppList`
+        :raises ValueError: Raised if the file isn't a saved app list.
+        '''
+
+        with open(path, 'rb') as a:
+            data = _mmap(a.fileno(), 0, access=_ACCESS_READ)
+
+        view = memoryview(data)
+        if len(view) < cls._header.size:
+            raise ValueError('The file is not a saved app list.')
+        magic, version, count, blobLength = cls._header.unpack_from(view)
+        if magic != cls._magic or version != cls._version:
+            raise ValueError('The file is not a saved app list.')
+
+        # Make sure every section is there before cutting the file up, 64 bit ones first so they stay aligned
+        layout = (('Q', count), ('Q', count), ('I', count), ('I', count + 1), ('I', count), ('I', count), ('I', count), ('I', count))
+        if len(view) < cls._header.size + sum(length * (8 if code == 'Q' else 4) for code, length in layout) + blobLength:
+            raise ValueError('The saved app list is incomplete.')
+        sections = []
+        position = cls._header.size
+        for code, length in layout:
+            size = length * (8 if code == 'Q' else 4)
+            sections.append(view[position:position + size].cast(code))
+            position += size
+        blob = view[position:position + blobLength]
+
+        exactHashes, foldedHashes, appids, offsets, exactOrder, foldedOrder, sortedIDs, idOrder = sections
+        return cls(appids, offsets, blob, exactHashes, exactOrder, foldedHashes, foldedOrder, sortedIDs, idOrder)
+
+    def save(self, path: str):
+        '''
+        Writes the list to a file that can be opened with :meth:`load`, replacing whatever was there before.
+        The file is written next to the old one and then swapped in, so the list can be read while it's being saved.
+
+        :param str path: The path of the file.
+        '''
+
+        directory = _dirname(_abspath(path))
+        _makedirs(directory, exist_ok=True)
+
+        with _NamedTemporaryFile('wb', dir=directory, prefix='.applist', delete=False) as a:
+            try:
+                a.write(AppList._header.pack(AppList._magic, AppList._version, len(self), len(self._blob)))
+                for section in (self._exactHashes, self._foldedHashes, self._appids, self._offsets, self._exactOrder, self._foldedOrder, self._sortedIDs, self._idOrder):
+                    a.write(section)
+                a.write(self._blob)
+            except BaseException:
+                a.close()
+                _unlink(a.name)
+                raise
+        _replace(a.name, path)
+
+    def __len__(self):
+        return len(self._appids)
+
+    def __iter__(self):
+        for position in range(len(self._appids)):
+            yield self._appids[position], self.nameAt(position)
+
+    def nameAt(self, position: int) -> str:
+        '''
+        Gives the name of the app at a position in the list.
+
+        :param int position: The position of the app.
+        :rtype: str
+        '''
+
+        return bytes(self._blob[self._offsets[position]:self._offsets[position + 1]]).decode('utf-8')
+
+    def getID(self, name: str, caseSensitive: bool=True) -> str:
+        '''
+        Gives the ID of an app from its name, or `None` if there is no app with that name.
+
+        :param str name: The name of the app.
+        :param bool caseSensitive: Whether or not the name being searched for is case sensitive or not.
+        :return: The ID of the app.
+        :rtype: Optional[str]
+        '''
+
+        if caseSensitive:
+            hashes, order = self._exactHashes, self._exactOrder
+        else:
+            name = name.casefold()
+            hashes, order = self._foldedHashes, self._foldedOrder
+
+        # Run through everything with the same hash, in case two names share one
+        key = _hashName(name)
+        index = _bisect_left(hashes, key)
+        while index < len(hashes) and hashes[index] == key:
+            position = order[index]
+            found = self.nameAt(position)
+            if found == name or (not caseSensitive and found.casefold() == name):
+                return str(self._appids[position])
+            index += 1
+        return None
+
+    def getName(self, appid: str) -> str:
+        '''
+        Gives the name of an app from its ID, or `None` if there is no app with that ID.
+
+        :param str appid: The ID of the app.
+        :rtype: Optional[str]
+        '''
+
+        appid = int(appid)
+        index = _bisect_left(self._sortedIDs, appid)
+        if index < len(self._sortedIDs) and self._sortedIDs[index] == appid:
+            return self.nameAt(self._idOrder[index])
+        return None
@@ -0,0 +1,68 @@
+from os import environ as _environ
+from os.path import expanduser as _expanduser
+from os.path import getmtime as _getmtime
+from os.path import join as _join
+from time import time as _time
+from .applist import AppList as _AppList
+
+
+def defaultCacheDir() -> str:
+    '''
+    Gives the directory Steamfront keeps its caches in when no other is given - `steamfront` inside of `$XDG_CACHE_HOME`, or `~/.cache`.
+
+    :rtype: str
+    '''
+
+    base = _environ.get('XDG_CACHE_HOME') or _expanduser('~/.cache')
+    return _join(base, 'steamfront')
+
+
+class AppListCache(object):
+    '''
+    Keeps a copy of the list of every app on Steam on disk, so that it can be shared between processes and doesn't need to be downloaded each time one starts.
+    The file is always replaced atomically, so it can be read while another process is refreshing it, and is mapped into memory rather than read so that processes share it.
+
+    :param cacheDir: The directory to keep the list in. Defaults to the value of :func:`steamfront.applistcache.defaultCacheDir`.
+    :type cacheDir: Optional[str]
+    '''
+
+    fileName = 'applist.bin'
+
+    def __init__(self, cacheDir: str=None):
+
+        self.cacheDir = cacheDir if cacheDir is not None else defaultCacheDir()
+        self.path = _join(self.cacheDir, AppListCache.fileName)
+
+    def age(self) -> float:
+        '''
+        Gives how long ago, in seconds, the list on disk was saved, or `None` if there isn't one.
+
+        :rtype: Optional[float]
+        '''
+
+        try:
+            return _time() - _getmtime(self.path)
+        except OSError:
+            return None
+
+    def load(self) -> _AppList:
+        '''
+        Opens the list on disk. Stale lists are still given back - use :meth:`age` to decide whether to refresh them.
+
+        :return: The list of apps, or `None` if there's no readable list on disk.
+        :rtype: Optional[steamfront.applist.AppList]
+        '''
+
+        try:
+            return _AppList.load(self.path)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, appList: _AppList):
+        '''
+        Writes the list to disk, replacing whatever was there before.
+
+        :param steamfront.applist.AppList appList: The list of apps.
+        '''
+
+        appList.save(self.path)
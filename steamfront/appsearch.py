@@ -0,0 +1,140 @@
+from array import array as _array
+from bisect import bisect_left as _bisect_left
+from heapq import nlargest as _nlargest
+from re import compile as _compile
+from unicodedata import combining as _combining
+from unicodedata import normalize as _normalize
+
+
+_nonWord = _compile(r'[\W_]+')
+
+
+def normalizeName(name: str) -> str:
+    '''
+    Gives a version of an app's name that's suited to searching - without accents, punctuation, case, or repeated spaces.
+
+    :param str name: The name to normalize.
+    :rtype: str
+    '''
+
+    if not name.isascii():
+        name = ''.join(i for i in _normalize('NFKD', name) if not _combining(i))
+    return _nonWord.sub(' ', name.casefold()).strip()
+
+
+def trigrams(name: str) -> set:
+    '''
+    Gives the set of three character sequences in each word of a normalized name, with each word padded by spaces so the start and end of words count for more.
+
+    :param str name: A name that's been through :func:`steamfront.appsearch.normalizeName`.
+    :rtype: set
+    '''
+
+    output = set()
+    for word in name.split():
+        word = '  {} '.format(word)
+        output.update(word[i:i + 3] for i in range(len(word) - 2))
+    return output
+
+
+class AppSearchIndex(object):
+    '''
+    An index of app names for fuzzy and prefix searching, built once from the app list.
+    Names are matched on the trigrams they share with the query, so results come back quickly no matter how many apps there are.
+    Should not be made manually - will be automatically generated by :meth:`steamfront.client.Client.searchApps`.
+
+    :param apps: The apps to index, as `(appid, name)` pairs - such as a :class:`steamfront.applist.AppList`.
+    :type apps: Iterable[tuple]
+    '''
+
+    # Trigrams in more than this fraction of names only add to the scores of names already found
+    commonFraction = 0.05
+
+    def __init__(self, apps: list):
+
+        self._appids = []
+        self._names = []
+        self._normalized = []
+        gramCounts = []
+        postings = {}
+
+        for appid, name in apps:
+            normalized = normalizeName(name)
+            if not normalized:
+                continue
+            index = len(self._appids)
+            self._appids.append(str(appid))
+            self._names.append(name)
+            self._normalized.append(normalized)
+            grams = trigrams(normalized)
+            gramCounts.append(min(len(grams), 65535))
+            for gram in grams:
+                postings.setdefault(gram, []).append(index)
+
+        self._postings = {gram: _array('I', indexes) for gram, indexes in postings.items()}
+        self._gramCounts = _array('H', gramCounts)
+
+        # Keep the names in order as well, so prefixes can be found with a binary search
+        self._prefixOrder = sorted(range(len(self._normalized)), key=self._normalized.__getitem__)
+        self._prefixNames = [self._normalized[i] for i in self._prefixOrder]
+
+    def __len__(self):
+        return len(self._appids)
+
+    def _prefixed(self, query: str, limit: int) -> list:
+        '''
+        Gives the indexes of up to `limit` names starting with the normalized query.
+        '''
+
+        output = []
+        start = _bisect_left(self._prefixNames, query)
+        for position in range(start, min(start + limit, len(self._prefixNames))):
+            if not self._prefixNames[position].startswith(query):
+                break
+            output.append(self._prefixOrder[position])
+        return output
+
+    def search(self, query: str, *, limit: int=10, minScore: float=0.0) -> list:
+        '''
+        Gives the apps whose names best match the query, best first.
+
+        :param str query: The name, or part of the name, to search for.
+        :param int limit: The most results to give back.
+        :param float minScore: The lowest score a result can have.
+        :return: A `list` of `(appid, name, score)` tuples, where a score of `1.0` is an exact match once case, accents, and punctuation are ignored.
+        :rtype: list
+        '''
+
+        normalized = normalizeName(query)
+        if not normalized:
+            return []
+        queryGrams = trigrams(normalized)
+
+        # Count the trigrams each name shares with the query, starting with the rarest
+        shared = {}
+        common = len(self._appids) * AppSearchIndex.commonFraction
+        for gram in sorted(queryGrams, key=lambda i: len(self._postings.get(i, ()))):
+            indexes = self._postings.get(gram, ())
+            if shared and len(indexes) > common:
+                for index in indexes:
+                    if index in shared:
+                        shared[index] += 1
+            else:
+                for index in indexes:
+                    shared[index] = shared.get(index, 0) + 1
+
+        # Score them on how similar their trigram sets are, keeping a perfect score for names that really are the same
+        scores = {}
+        for index, count in shared.items():
+            scores[index] = min(0.99, count / (len(queryGrams) + self._gramCounts[index] - count))
+
+        # Names that start with the query are scored on how much of the name it covers
+        for index in self._prefixed(normalized, max(limit, 1) * 10):
+            name = self._normalized[index]
+            prefixScore = 1.0 if name == normalized else 0.5 + 0.49 * len(normalized) / len(name)
+            scores[index] = max(scores.get(index, 0), prefixScore)
+
+        # Ties go to the names closest in length to the query
+        ranking = lambda i: (i[1], -abs(len(self._normalized[i[0]]) - len(normalized)))
+        best = _nlargest(limit, (i for i in scores.items() if i[1] >= minScore), key=ranking)
+        return [(self._appids[index], self._names[index], round(score, 4)) for index, score in best]
@@ -0,0 +1,304 @@
+from asyncio import Semaphore as _Semaphore
+from asyncio import TimeoutError as _TimeoutError
+from asyncio import sleep as _sleep
+from asyncio import ensure_future as _ensure_future
+from asyncio import shield as _shield
+from random import uniform as _uniform
+from urllib.parse import quote as _quote
+from .app import App as _App
+from .applist import AppList as _AppList
+from .user import User as _User
+from .transport import Transport as _Transport
+from .cache import MemoryBackend as _MemoryBackend
+from .cache import ResponseCache as _ResponseCache
+from .errors import AppNotFound as _AppNotFound
+from .errors import UserNotFound as _UserNotFound
+from .errors import APIKeyRequired as _APIKeyRequired
+from .errors import MissingArguments as _MissingArguments
+from .errors import RequestFailed as _RequestFailed
+from .errors import RateLimited as _RateLimited
+
+
+class AiohttpTransport(object):
+    '''
+    The default transport for a :class:`steamfront.asyncclient.AsyncClient`, sending every request through one shared `aiohttp` session.
+    Requires `aiohttp` to be installed.
+
+    Any other object with the coroutines `getJSON(url)` and `close()` can be given to the client in its place.
+
+    Requests that fail because of throttling, server errors, or connection problems are retried in the same way as by a :class:`steamfront.transport.Transport`.
+
+    :param int limit: The largest number of connections to keep in the session's pool.
+    :param float timeout: How long, in seconds, a request can take before it's given up on.
+    :param int retries: How many times a failed request is retried before giving up.
+    :param float backoff: The base delay, in seconds, between retries. This doubles with each attempt.
+    :param float maxBackoff: The longest delay, in seconds, between retries.
+    '''
+
+    def __init__(self, *, limit: int=100, timeout: float=30, retries: int=3, backoff: float=1, maxBackoff: float=60):
+
+        self.retries = retries
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self._limit = limit
+        self._timeout = timeout
+        self._session = None
+        self._errors = ()
+
+    def _getSession(self):
+        '''
+        Gives the shared session, making it the first time it's needed so that it's made inside the running event loop.
+        '''
+
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError('aiohttp is required to use the default transport for an AsyncClient.')
+
+            connector = aiohttp.TCPConnector(limit=self._limit)
+            timeout = aiohttp.ClientTimeout(total=self._timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._errors = (aiohttp.ClientError, _TimeoutError)
+        return self._session
+
+    def _delay(self, attempt: int, retryAfter: float=None) -> float:
+        '''
+        Gives how long to wait before the next attempt at a request.
+        '''
+
+        delay = _uniform(0, min(self.maxBackoff, self.backoff * 2 ** attempt))
+        if retryAfter is not None:
+            delay = max(delay, min(self.maxBackoff, retryAfter))
+        return delay
+
+    async def getJSON(self, url: str):
+        '''
+        Gives the decoded JSON body of the given URL, retrying the request if needed.
+
+        :raises steamfront.errors.RateLimited: Raised if Steam was still throttling requests after every retry.
+        :raises steamfront.errors.RequestFailed: Raised if the request couldn't be made successfully.
+        '''
+
+        session = self._getSession()
+        for attempt in range(self.retries + 1):
+            retryAfter = None
+            try:
+                async with session.get(url) as site:
+                    if site.status < 400:
+                        return await site.json(content_type=None)
+                    if site.status not in _Transport.RETRY_STATUSES:
+                        raise _RequestFailed('Steam responded with status {}.'.format(site.status))
+
+                    if site.status == 429:
+                        error = _RateLimited('Steam is rate limiting requests.')
+                    else:
+                        error = _RequestFailed('Steam responded with status {}.'.format(site.status))
+                    try:
+                        retryAfter = float(site.headers.get('Retry-After'))
+                    except (TypeError, ValueError):
+                        pass
+            except self._errors as e:
+                error = _RequestFailed('The request to Steam could not be made: {}'.format(e))
+
+            if attempt < self.retries:
+                await _sleep(self._delay(attempt, retryAfter))
+        raise error
+
+    async def close(self):
+        '''
+        Closes the shared session and all of its connections.
+        '''
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncClient(object):
+    '''
+    An `asyncio` version of :class:`steamfront.client.Client`, where each lookup is a coroutine. Many lookups can be waited on at once, sharing one connection pool.
+    Should be closed with :meth:`close` when you're done with it, or used with ``async with``.
+
+    :param apiKey: The key used for API functions. This is not required for all methods, but a good few of them. Defaults to ``None`` if no key is passed on client creation.
+    :type apiKey: Optional[str]
+    :param transport: The object used to make requests. Defaults to an :class:`steamfront.asyncclient.AiohttpTransport`.
+    :param int concurrency: The most requests to have running at once.
+    :param nameCache: The :class:`steamfront.cache.ResponseCache` to keep users' names, and names that belong to nobody, in. Defaults to one in memory. The :attr:`steamfront.client.Client.nameCache` of a client can be given to share it.
+    :type nameCache: Optional[steamfront.cache.ResponseCache]
+    :ivar nameCache: The :class:`steamfront.cache.ResponseCache` that users' names are kept in.
+    '''
+
+    nameCacheSize = 100000
+
+    def __init__(self, apiKey: str=None, *, transport=None, concurrency: int=64, nameCache: _ResponseCache=None):
+
+        self._apiKey = apiKey
+        self._appList = None
+        self._appListTask = None
+        self._nameTasks = {}
+        self.nameCache = nameCache if nameCache is not None else _ResponseCache(backend=_MemoryBackend(maxEntries=AsyncClient.nameCacheSize))
+        self._transport = transport if transport is not None else AiohttpTransport(limit=concurrency)
+        self._semaphore = _Semaphore(concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        '''
+        Closes the client's transport.
+        '''
+
+        await self._transport.close()
+
+    async def _getJSON(self, url: str):
+        '''
+        Gets a URL through the transport, waiting for a free slot first.
+        '''
+
+        async with self._semaphore:
+            return await self._transport.getJSON(url)
+
+    async def _getGamesFromSteam(self) -> _AppList:
+        '''
+        Gives a list of all games on Steam.
+        '''
+
+        # Get the list from the API
+        steamAppList = 'http://api.steampowered.com/ISteamApps/GetAppList/v0001/'
+        jsonGames = await self._getJSON(steamAppList)
+        gameList = _AppList.fromApps(jsonGames['applist']['apps']['app'])
+
+        # Store everything nicely
+        self._appList = gameList
+        return gameList
+
+    async def _getIDOfApp(self, name: str, caseSensitive: bool=True) -> str:
+        '''
+        Gives the ID of an app whose name you have
+        '''
+
+        # Make the app list if necessary, with every lookup waiting on the one download
+        if self._appList == None:
+            if self._appListTask is None:
+                self._appListTask = _ensure_future(self._getGamesFromSteam())
+            task = self._appListTask
+            try:
+                await _shield(task)
+            except Exception:
+                # Let the next lookup try again
+                if self._appListTask is task:
+                    self._appListTask = None
+                raise
+
+        # Look the game's name up in the list
+        appid = self._appList.getID(name, caseSensitive)
+        if appid is not None:
+            return appid
+
+        # No game found, raise error
+        raise _AppNotFound(
+            'The name `{}` was not found on the API. Try using an app ID.'.format(name))
+
+    async def getApp(self, *, name: str=None, appid: str=None, caseSensitive: bool=True) -> _App:
+        '''
+        Returns a :class:`steamfront.app.App` of the name or app ID that was input to the function.
+
+        :param str appid: The ID of the app you're getting the object of.
+        :param str name: The name of the app you're getting the object of. May not be 100% accurate.
+        :param bool caseSensitive: Whether or not the name being searched for is case sensitive or not. Has no effect on appid.
+        :return: The object of relevant data on the app.
+        :rtype: :class:`steamfront.app.App`
+        :raises steamfront.errors.MissingArguments: Raised if there is neither a name or an app id passed.
+        :raises steamfront.errors.AppNotFound: Raised if the app or name provided can't be found.
+        '''
+
+        if appid is None and name is None:
+
+            # Neither was passed, raise MissingArguments
+            raise _MissingArguments('Missing parameters: `name` or `appid`.')
+
+        if appid is None:
+
+            # A name was passed, get its ID
+            appid = await self._getIDOfApp(name, caseSensitive)
+
+        appid = str(appid)
+        rawdata = await self._getJSON(_App.getGame.format(appid))
+        return _App.fromPayload(rawdata.get(appid) if isinstance(rawdata, dict) else None)
+
+    async def _getIDOfUser(self, name: str) -> str:
+        '''
+        Gives the ID64 of a user whose name you have.
+        '''
+
+        # Names that have been looked up lately don't need to be asked for again, whether they were found or not
+        id64 = self.nameCache.get('vanity', name)
+        if id64 is not None:
+            return id64
+        if self.nameCache.get('vanitymissing', name) is None:
+
+            # Every lookup of the same name waits on the one request
+            task = self._nameTasks.get(name)
+            if task is None:
+                task = self._nameTasks[name] = _ensure_future(self._requestIDOfUser(name))
+                task.add_done_callback(lambda _: self._nameTasks.pop(name, None))
+            id64 = await _shield(task)
+            if id64 is not None:
+                return id64
+
+        # No user found, raise error
+        raise _UserNotFound('The name `{}` was not found on the API. Try using an ID64.'.format(name))
+
+    async def _requestIDOfUser(self, name: str) -> str:
+        rawdata = await self._getJSON(_User.resolveName.format(key=self._apiKey, name=_quote(name, safe='')))
+        response = rawdata.get('response') or {}
+
+        # A success of 1 is a match and 42 is no match - anything else is Steam failing to look
+        if response.get('success') == 1:
+            self.nameCache.set('vanity', name, response['steamid'])
+            return response['steamid']
+        if response.get('success') == 42:
+            self.nameCache.set('vanitymissing', name, True)
+            return None
+        raise _RequestFailed('Steam could not look up the name `{}`: {}'.format(name, response.get('message', 'no reason given')))
+
+    async def getUser(self, *, name: str=None, id64: str=None) -> _User:
+        '''
+        Returns a :class:`steamfront.user.User` of the name or ID64 that was input to the function.
+
+        :param str id64: The ID64 of a user you want the object of.
+        :param str name: The Steam ID (name) of a user you want the object of. Names are case sensitive.
+        :return: The object of relevant data on the user.
+        :rtype: :class:`steamfront.user.User`
+        :raises steamfront.errors.MissingArguments: Raised if there is neither a name or an ID64 passed.
+        :raises steamfront.errors.APIKeyRequired: An API key is needed to get user information from Steam.
+        :raises steamfront.errors.UserNotFound: Raised if the user's ID64 or name is not able to be found on Steam.
+        :raises steamfront.errors.RequestFailed: Raised if Steam fails to look up the name.
+        '''
+
+        if id64 is None and name is None:
+
+            # Neither was passed, raise MissingArguments
+            raise _MissingArguments('Missing parameters: `name` or `id64`.')
+
+        # You need an API key to get any user data
+        if self._apiKey == None:
+            raise _APIKeyRequired('An API key is required to get user information from the Steam API.')
+
+        if id64 is None:
+
+            # A name was passed, get its ID64
+            id64 = await self._getIDOfUser(name)
+
+        # Get the summary and the games
+        rawdata = await self._getJSON(_User.getUser.format(id64=id64, key=self._apiKey))
+        try:
+            userdata = rawdata['response']['players'][0]
+        except IndexError:
+            raise _UserNotFound('The specified user could not be found.')
+        gamedata = await self._getJSON(_User.userGames.format(id64=id64, key=self._apiKey))
+        return _User.fromPayload(userdata, gamedata['response'])
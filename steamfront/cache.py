@@ -0,0 +1,250 @@
+from collections import OrderedDict as _OrderedDict
+from json import dumps as _dumps
+from json import loads as _loads
+from os import makedirs as _makedirs
+from os.path import dirname as _dirname
+from threading import Lock as _Lock
+from time import time as _time
+
+
+class MemoryBackend(object):
+    '''
+    Keeps cached responses in memory, throwing out the least recently used once it's full.
+
+    :param int maxEntries: The most responses to keep.
+    :param maxBytes: The most bytes of JSON to keep, if there should be a limit on that as well.
+    :type maxBytes: Optional[int]
+    '''
+
+    def __init__(self, *, maxEntries: int=10000, maxBytes: int=None):
+
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self._entries = _OrderedDict()  # key -> (expires, value, size)
+        self._bytes = 0
+        self._lock = _Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple:
+        '''
+        Gives a tuple of `(expires, value)` for the key, or `None` if it isn't stored.
+        '''
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0], entry[1]
+
+    def set(self, key: str, value, expires: float):
+        '''
+        Stores a value under the key until the given Unix time.
+        '''
+
+        size = len(_dumps(value)) if self.maxBytes is not None else 0
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (expires, value, size)
+            self._bytes += size
+
+            # Throw out the oldest entries until everything fits
+            while len(self._entries) > self.maxEntries or (self.maxBytes is not None and self._bytes > self.maxBytes and len(self._entries) > 1):
+                _, old = self._entries.popitem(last=False)
+                self._bytes -= old[2]
+
+    def delete(self, key: str):
+        '''
+        Removes the key, if it's stored.
+        '''
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+
+    def clear(self):
+        '''
+        Removes everything.
+        '''
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+class DiskBackend(object):
+    '''
+    Keeps cached responses in an SQLite database, so that they can be shared between processes and kept between runs.
+    Throws out the least recently used responses once it's full.
+
+    :param str path: The path of the database file.
+    :param int maxEntries: The most responses to keep. The database is trimmed back down to this every so often, rather than on every write.
+    '''
+
+    pruneEvery = 1000
+
+    def __init__(self, path: str, *, maxEntries: int=100000):
+
+        import sqlite3
+
+        if _dirname(path):
+            _makedirs(_dirname(path), exist_ok=True)
+        self.path = path
+        self.maxEntries = maxEntries
+        self._lock = _Lock()
+        self._writes = 0
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, used REAL, value TEXT)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_used ON responses (used)')
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def get(self, key: str) -> tuple:
+        '''
+        Gives a tuple of `(expires, value)` for the key, or `None` if it isn't stored.
+        '''
+
+        with self._lock:
+            row = self._db.execute('SELECT expires, value FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute('UPDATE responses SET used = ? WHERE key = ?', (_time(), key))
+        return row[0], _loads(row[1])
+
+    def set(self, key: str, value, expires: float):
+        '''
+        Stores a value under the key until the given Unix time.
+        '''
+
+        data = _dumps(value, separators=(',', ':'))
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)', (key, expires, _time(), data))
+
+            # Throw out the least recently used entries now and then
+            self._writes += 1
+            if self._writes % DiskBackend.pruneEvery == 0:
+                self._db.execute(
+                    'DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY used DESC LIMIT -1 OFFSET ?)',
+                    (self.maxEntries,))
+
+    def delete(self, key: str):
+        '''
+        Removes the key, if it's stored.
+        '''
+
+        with self._lock:
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def clear(self):
+        '''
+        Removes everything.
+        '''
+
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+
+class ResponseCache(object):
+    '''
+    A cache of responses from Steam, which a :class:`steamfront.client.Client` can be given to save it from asking for the same data twice.
+    Each kind of data is kept for its own length of time, and hits and misses are counted for each kind.
+
+    The kinds of data used by the client are `appdetails`, `summary` (a user's player summary), `ownedgames`, `vanity` (the ID64 a user's name belongs to), and `vanitymissing` (names that belong to nobody).
+
+    :param ttls: A `dict` of kind to how long, in seconds, that kind is kept for. Anything not given uses the value from :attr:`TTLS`.
+    :type ttls: Optional[dict]
+    :param backend: Where the responses are kept. Defaults to a :class:`steamfront.cache.MemoryBackend`.
+    :ivar stats: A `dict` of kind to a `dict` with the keys `hits` and `misses`.
+    :ivar metrics: A :class:`steamfront.metrics.Metrics` that hits and misses are also counted in, or `None`.
+    '''
+
+    TTLS = {
+        'appdetails': 6 * 60 * 60,
+        'summary': 5 * 60,
+        'ownedgames': 60 * 60,
+        'vanity': 24 * 60 * 60,
+        'vanitymissing': 5 * 60,
+    }
+
+    def __init__(self, *, ttls: dict=None, backend=None):
+
+        self.ttls = dict(ResponseCache.TTLS, **(ttls or {}))
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.stats = {}
+        self.metrics = None
+        self._lock = _Lock()
+
+    def _count(self, kind: str, stat: str):
+        with self._lock:
+            counts = self.stats.setdefault(kind, {'hits': 0, 'misses': 0})
+            counts[stat] += 1
+        if self.metrics is not None:
+            self.metrics.recordCache(kind, stat == 'hits')
+
+    def get(self, kind: str, key: str, default=None):
+        '''
+        Gives the cached value of a kind of data, or the default if it isn't cached or has expired.
+
+        :param str kind: The kind of data.
+        :param str key: The key of the data, such as an app ID.
+        :param default: What to give back if the value isn't cached.
+        '''
+
+        entry = self.backend.get('{}:{}'.format(kind, key))
+        if entry is None or entry[0] <= _time():
+            self._count(kind, 'misses')
+            return default
+        self._count(kind, 'hits')
+        return entry[1]
+
+    def getEntry(self, kind: str, key: str) -> tuple:
+        '''
+        Gives the cached value of a kind of data along with when it expires, even if it already has. Only values that haven't expired are counted as hits.
+
+        :param str kind: The kind of data.
+        :param str key: The key of the data, such as an app ID.
+        :return: A tuple of `(expires, value)`, where `expires` is a Unix time, or `None` if nothing is cached.
+        :rtype: Optional[tuple]
+        '''
+
+        entry = self.backend.get('{}:{}'.format(kind, key))
+        self._count(kind, 'hits' if entry is not None and entry[0] > _time() else 'misses')
+        return entry
+
+    def set(self, kind: str, key: str, value):
+        '''
+        Caches the value of a kind of data.
+
+        :param str kind: The kind of data.
+        :param str key: The key of the data, such as an app ID.
+        :param value: The data. This must be able to be turned into JSON.
+        '''
+
+        ttl = self.ttls.get(kind, 0)
+        if ttl > 0:
+            self.backend.set('{}:{}'.format(kind, key), value, _time() + ttl)
+
+    def delete(self, kind: str, key: str):
+        '''
+        Removes a value from the cache.
+
+        :param str kind: The kind of data.
+        :param str key: The key of the data, such as an app ID.
+        '''
+
+        self.backend.delete('{}:{}'.format(kind, key))
+
+    def clear(self):
+        '''
+        Removes everything from the cache.
+        '''
+
+        self.backend.clear()
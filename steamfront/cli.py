@@ -0,0 +1,140 @@
+'''
+The ``steamfront`` command, which looks up many apps at once and writes them out as JSON lines.
+
+    steamfront "Half-Life 2" Portal
+    steamfront --file names.txt --fields appid,name,genres
+    cut -f1 appids.tsv | steamfront --appids --concurrency 16
+'''
+
+from argparse import ArgumentParser as _ArgumentParser
+from itertools import islice as _islice
+from json import dumps as _dumps
+from os.path import join as _join
+import sys as _sys
+from .app import App as _App
+from .applistcache import defaultCacheDir as _defaultCacheDir
+from .cache import DiskBackend as _DiskBackend
+from .cache import ResponseCache as _ResponseCache
+from .client import Client as _Client
+
+
+FIELDS = _App.FIELDS + ('raw',)
+DEFAULT_FIELDS = ('appid', 'name', 'type')
+responseCacheFile = 'responses.sqlite'
+
+
+def _parser() -> _ArgumentParser:
+    parser = _ArgumentParser(prog='steamfront', description='Look up apps on Steam by name or ID, writing one line of JSON for each.')
+    parser.add_argument('queries', nargs='*', help='names (or IDs with --appids) to look up. Read from --file, or standard input, if none are given')
+    parser.add_argument('-f', '--file', help='a file with one name or ID on each line, or - for standard input')
+    parser.add_argument('--appids', action='store_true', help='treat each query as an app ID rather than a name')
+    parser.add_argument('-i', '--ignore-case', action='store_true', help='match names regardless of case')
+    parser.add_argument('--fields', default=','.join(DEFAULT_FIELDS), help='comma separated app attributes to write out, or "all" (default: %(default)s)')
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help='the most requests to have running at once (default: %(default)s)')
+    parser.add_argument('--cache-dir', default=_defaultCacheDir(), help='where to keep the app list and responses between runs (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true', help='keep nothing on disk, downloading the app list each run')
+    return parser
+
+
+def _queries(options):
+    '''
+    Gives each query, from the command line, a file, or standard input, skipping blank lines.
+    '''
+
+    if options.queries:
+        lines = iter(options.queries)
+    elif options.file and options.file != '-':
+        lines = open(options.file, encoding='utf-8')
+    else:
+        lines = _sys.stdin
+
+    try:
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line
+    finally:
+        if hasattr(lines, 'close') and lines is not _sys.stdin:
+            lines.close()
+
+
+def _jsonable(value):
+    # Attributes that weren't in the app's data are stored as the exception raised getting them
+    return None if isinstance(value, Exception) else value
+
+
+def _row(query: str, result, fields: tuple) -> dict:
+    if isinstance(result, Exception):
+        return {'query': query, 'error': type(result).__name__, 'message': str(result)}
+    row = {'query': query}
+    for field in fields:
+        row[field] = _jsonable(getattr(result, field))
+    return row
+
+
+def _lookup(client, batch: list, options) -> list:
+    '''
+    Gives the result of each query in a batch, in order - either its app, or the exception raised for it.
+    '''
+
+    appids = {}
+    for query in batch:
+        if options.appids:
+            appids[query] = query
+        else:
+            try:
+                appids[query] = client._getIDOfApp(query, not options.ignore_case)
+            except Exception as e:
+                appids[query] = e
+
+    apps = client.getApps([i for i in appids.values() if not isinstance(i, Exception)], concurrency=options.concurrency)
+    return [appids[i] if isinstance(appids[i], Exception) else apps[str(appids[i])] for i in batch]
+
+
+def main(argv: list=None) -> int:
+    '''
+    Runs the ``steamfront`` command.
+
+    :param argv: The command's arguments, without the program's name. Defaults to :data:`sys.argv`.
+    :type argv: Optional[list]
+    :return: The exit code - `0` if every query was found, `1` if any weren't, and `2` for bad arguments.
+    :rtype: int
+    '''
+
+    parser = _parser()
+    options = parser.parse_args(argv)
+
+    fields = FIELDS if options.fields == 'all' else tuple(i.strip() for i in options.fields.split(',') if i.strip())
+    unknown = [i for i in fields if i not in FIELDS]
+    if unknown:
+        parser.error('unknown fields: {}. Choose from {}'.format(', '.join(unknown), ', '.join(FIELDS)))
+    if options.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+
+    # Responses are kept alongside the app list, so running again over the same queries is quick
+    if options.no_cache:
+        client = _Client()
+    else:
+        cache = _ResponseCache(backend=_DiskBackend(_join(options.cache_dir, responseCacheFile)))
+        client = _Client(cacheDir=options.cache_dir, cache=cache)
+
+    # Queries are looked up a batch at a time, so results are written as they come in and in the order they were given
+    failed = False
+    queries = _queries(options)
+    try:
+        while True:
+            batch = list(_islice(queries, options.concurrency * 4))
+            if not batch:
+                break
+            for query, result in zip(batch, _lookup(client, batch, options)):
+                failed = failed or isinstance(result, Exception)
+                print(_dumps(_row(query, result, fields), default=str, ensure_ascii=False), flush=True)
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # Whatever was reading the output stopped, such as `head`
+        _sys.stderr.close()
+        return 1
+    finally:
+        client.close()
+    return 1 if failed else 0
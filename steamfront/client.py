@@ -1,65 +1,273 @@
-from requests import get as _get
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from logging import getLogger as _getLogger
+from os.path import join as _join
+from threading import Lock as _Lock
+from threading import Thread as _Thread
+from time import time as _time
+from urllib.parse import quote as _quote
+from weakref import WeakValueDictionary as _WeakValueDictionary
 from .app import App as _App
+from .applist import AppList as _AppList
+from .applistcache import AppListCache as _AppListCache
+from .appsearch import AppSearchIndex as _AppSearchIndex
+from .cache import DiskBackend as _DiskBackend
+from .cache import MemoryBackend as _MemoryBackend
+from .cache import ResponseCache as _ResponseCache
+from .jsonstream import iterArray as _iterArray
+from .metrics import Metrics as _Metrics
+from .price import priceFromPayload as _priceFromPayload
+from .prefetch import PrefetchScheduler as _PrefetchScheduler
+from .singleflight import SingleFlight as _SingleFlight
 from .user import User as _User
+from .transport import Transport as _Transport
 from .errors import AppNotFound as _AppNotFound
+from .errors import UserNotFound as _UserNotFound
+from .errors import APIKeyRequired as _APIKeyRequired
 from .errors import MissingArguments as _MissingArguments
+from .errors import RequestFailed as _RequestFailed
+
+
+_log = _getLogger(__name__)
 
 
 class Client(object):
     '''
     Provides a client for you to get apps, users, and other miscellania with.
+    A client can be shared between threads. When several threads ask for the same app, user, or the list of apps at once, only one request is made and they all get its result.
 
     :param apiKey: The key used for API functions. This is not required for all methods, but a good few of them. Defaults to ``None`` if no key is passed on client creation.
     :type apiKey: Optional[str]
+    :param transport: The :class:`steamfront.transport.Transport` that all of the client's requests, and those of the objects it makes, go through. Make one yourself to change the pool size, timeouts, retries, or rate limits.
+    :param cacheDir: A directory to keep the list of every app on Steam, and the ID64s that users' names belong to, in so that they can be shared between processes. Neither is kept on disk if this isn't given - :func:`steamfront.applistcache.defaultCacheDir` gives a sensible place for it.
+    :type cacheDir: Optional[str]
+    :param float appListTTL: How long, in seconds, the list of apps is used for before it's refreshed in the background. A refresh that fails is tried again after :attr:`appListRetryDelay` seconds.
+    :param cache: A :class:`steamfront.cache.ResponseCache` to keep app details, player summaries, and owned games in. Pass `True` to use one kept in memory with the default settings. Nothing is cached if this isn't given.
+    :type cache: Optional[Union[bool, steamfront.cache.ResponseCache]]
+    :param metrics: A :class:`steamfront.metrics.Metrics` to record requests, cache lookups, and timings in. Pass `True` to make a new one. Nothing is recorded if this isn't given.
+    :type metrics: Optional[Union[bool, steamfront.metrics.Metrics]]
+    :param prefetch: A :class:`steamfront.prefetch.PrefetchScheduler` to keep often used apps and users fresh in the cache in the background, and to keep giving back entries for a while after they expire. Pass `True` to use one with the default settings. A cache is made if one isn't given.
+    :type prefetch: Optional[Union[bool, steamfront.prefetch.PrefetchScheduler]]
+    :ivar cache: The :class:`steamfront.cache.ResponseCache` the client is using, or `None`.
+    :ivar metrics: The :class:`steamfront.metrics.Metrics` the client is recording in, or `None`.
+    :ivar nameCache: The :class:`steamfront.cache.ResponseCache` that users' names, and names that belong to nobody, are kept in. This is always used, and is kept in `cacheDir` if one is given.
+    :ivar prefetch: The :class:`steamfront.prefetch.PrefetchScheduler` the client is using, or `None`.
     '''
 
-    def __init__(self, apiKey: str=None):
+    steamAppList = 'http://api.steampowered.com/ISteamApps/GetAppList/v0001/'
+    appPrices = 'http://store.steampowered.com/api/appdetails?appids={}&filters=price_overview&cc={}'
+    summaryBatchSize = 100
+    nameCacheFile = 'vanity.sqlite'
+    nameCacheSize = 100000
+    appListRetryDelay = 300
+
+    def __init__(self, apiKey: str=None, *, transport: _Transport=None, cacheDir: str=None, appListTTL: float=86400, cache=None, metrics=None, prefetch=None):
 
         self._apiKey = apiKey
+        self._transport = transport if transport is not None else _Transport()
         self._appList = None
+        self._appListAge = None
+        self._appListLock = _Lock()
+        self._searchIndex = None
+        self._appListRefresh = None
+        self._appListTTL = appListTTL
+        self._appListCache = _AppListCache(cacheDir) if cacheDir is not None else None
+        self.cache = _ResponseCache() if cache is True else (cache or None)
+        self.metrics = _Metrics() if metrics is True else (metrics or None)
+        if cacheDir is not None:
+            self.nameCache = _ResponseCache(backend=_DiskBackend(_join(cacheDir, Client.nameCacheFile), maxEntries=Client.nameCacheSize))
+        else:
+            self.nameCache = _ResponseCache(backend=_MemoryBackend(maxEntries=Client.nameCacheSize))
+        if self.metrics is not None:
+            self._transport.metrics = self.metrics
+            self.nameCache.metrics = self.metrics
+            if self.cache is not None:
+                self.cache.metrics = self.metrics
+        self._loadedApps = _WeakValueDictionary()
+        self._flights = _SingleFlight()
+
+        # The prefetcher refreshes entries through the same requests that fill the cache
+        self.prefetch = _PrefetchScheduler() if prefetch is True else (prefetch or None)
+        if self.prefetch is not None:
+            if self.cache is None:
+                self.cache = _ResponseCache()
+                self.cache.metrics = self.metrics
+            self.prefetch.ttls = self.cache.ttls
+            self.prefetch.refreshers = {
+                'appdetails': self._fetchAppPayload,
+                'summary': lambda id64: self._flights.do(('summary', (id64,)), self._requestSummaries, (id64,)),
+                'ownedgames': lambda id64: self._flights.do(('ownedgames', id64), self._requestOwnedGames, id64),
+            }
 
         # # Populate game list
         # self._getGamesFromSteam()
 
-    def _getGamesFromSteam(self) -> list:
+    def close(self):
+        '''
+        Stops the client's background work, such as prefetching. The client can still be used afterwards, but nothing more is prefetched.
+        '''
+
+        if self.prefetch is not None:
+            self.prefetch.close()
+
+    def _getGamesFromSteam(self) -> _AppList:
         '''
         Gives a list of all games on Steam.
         '''
 
-        # Get the list from the API
-        steamAppList = 'http://api.steampowered.com/ISteamApps/GetAppList/v0001/'
-        dictGames = _get(steamAppList)
+        # Downloads that overlap, such as a refresh and a sync, share the one request
+        return self._flights.do(('applist', 'download'), self._downloadAppList)
 
-        # Get the list from the dictionary
-        jsonGames = dictGames.json()
-        gameList = jsonGames['applist']['apps']['app']
+    def _downloadAppList(self) -> _AppList:
+
+        # Get the list from the API, packing it down as it arrives
+        if self.metrics is None:
+            gameList = _AppList.fromApps(self.iterAppList())
+        else:
+            # The list is decoded as it's read, so this includes the time spent waiting on the network
+            with self.metrics.timer('decode', 'GetAppList'):
+                gameList = _AppList.fromApps(self.iterAppList())
 
         # Store everything nicely
-        self._appList = gameList
+        self._setAppList(gameList, _time())
+        if self._appListCache is not None:
+            try:
+                self._appListCache.save(gameList)
+            except OSError:
+                # The list is already in use, so a cache that can't be written to shouldn't stop it being used
+                _log.warning('Could not save the list of apps to %s.', self._appListCache.path, exc_info=True)
         return gameList
 
+    def iterAppList(self):
+        '''
+        Gives every app on Steam straight from the API, one at a time as the list is downloaded.
+        Only a small part of the list is held in memory at once, and nothing is kept afterwards.
+
+        :return: A generator of `dict`s with the keys `appid` and `name`.
+        :rtype: Iterator[dict]
+        '''
+
+        return _iterArray(self._transport.stream(Client.steamAppList), ('applist', 'apps', 'app'))
+
+    def _setAppList(self, gameList: _AppList, fetched: float):
+        '''
+        Swaps in a new list of apps.
+        '''
+
+        # The age is set first, so that no thread sees a list without one
+        with self._appListLock:
+            self._appListAge = fetched
+            self._appList = gameList
+
+    def _refreshAppList(self):
+        '''
+        Gets a new list of apps, keeping the current one if that fails. Lookups will try again after :attr:`appListRetryDelay` seconds.
+        '''
+
+        try:
+            self._getGamesFromSteam()
+        except Exception:
+            _log.warning('Could not refresh the list of apps.', exc_info=True)
+
+            # Count the current list as fetched just late enough that it's refreshed again after the delay, rather than on the very next lookup
+            with self._appListLock:
+                self._appListAge = max(self._appListAge, _time() - self._appListTTL + Client.appListRetryDelay)
+
+    def _refreshAppListInBackground(self):
+        '''
+        Starts getting a new list of apps on another thread, if that isn't already happening. Lookups carry on using the current list in the meantime.
+        '''
+
+        with self._appListLock:
+            if self._appListRefresh is not None and self._appListRefresh.is_alive():
+                return
+            self._appListRefresh = _Thread(target=self._refreshAppList, name='steamfront-applist', daemon=True)
+            self._appListRefresh.start()
+
+    def _loadFirstAppList(self):
+        '''
+        Gets the first list of apps, reading it from the disk cache where possible.
+        '''
+
+        # Another thread may have got the list while this one was waiting to
+        if self._appList is not None:
+            return
+
+        if self._appListCache is not None:
+
+            # Use the cached list straight away, even if it's out of date
+            age = self._appListCache.age()
+            gameList = self._appListCache.load() if age is not None else None
+            if gameList is not None:
+                self._setAppList(gameList, _time() - age)
+                return
+
+        # Nothing on disk, so the list has to be downloaded before it can be used
+        self._getGamesFromSteam()
+
+    def _loadAppList(self):
+        '''
+        Makes sure there's a list of apps to look names up in.
+        '''
+
+        if self._appList is None:
+
+            # Only one thread gets the list, and any others wait for it
+            self._flights.do(('applist',), self._loadFirstAppList)
+
+        if _time() - self._appListAge >= self._appListTTL:
+
+            # The list is out of date, so get a new one without making anyone wait for it
+            self._refreshAppListInBackground()
+
     def _getIDOfApp(self, name: str, caseSensitive: bool=True) -> str:
         '''
         Gives the ID of an app whose name you have
         '''
 
         # Refresh/make the app list if necessary
-        if self._appList == None:
-            self._getGamesFromSteam()
-
-        sensitive = lambda x, y: x == y['name']
-        unsensitive = lambda x, y: x.lower() == y['name'].lower()
-        searchStyle = {True: sensitive, False: unsensitive}[caseSensitive]
+        self._loadAppList()
 
-        # Iterate through the list and get the game's name.
-        for i in self._appList:
-            if searchStyle(name, i):
-                return i['appid']
+        # Look the game's name up in the list
+        appid = self._appList.getID(name, caseSensitive)
+        if appid is not None:
+            return appid
 
         # No game found, raise error
         raise _AppNotFound(
             'The name `{}` was not found on the API. Try using an app ID.'.format(name))
 
+    def searchApps(self, query: str, *, limit: int=10, minScore: float=0.0) -> list:
+        '''
+        Searches the names of every app on Steam, allowing for typos and partial names. Useful for when :meth:`getApp` can't find an app by its name.
+        The search index is made the first time this is used, and again whenever the list of apps is refreshed.
+
+        :param str query: The name, or part of the name, to search for.
+        :param int limit: The most results to give back.
+        :param float minScore: The lowest score a result can have, from `0.0` to `1.0`.
+        :return: A `list` of `(appid, name, score)` tuples, best first. A score of `1.0` is an exact match once case, accents, and punctuation are ignored.
+        :rtype: list
+        '''
+
+        self._loadAppList()
+
+        # Build the index if it's missing or was made from an older list
+        with self._appListLock:
+            gameList = self._appList
+            index = self._searchIndex
+        if index is None or index[0] is not gameList:
+
+            # Only one thread builds the index for each list, and any others wait for it
+            index = self._flights.do(('searchindex', id(gameList)), self._buildSearchIndex, gameList)
+
+        return index[1].search(query, limit=limit, minScore=minScore)
+
+    def _buildSearchIndex(self, gameList: _AppList) -> tuple:
+        index = (gameList, _AppSearchIndex(gameList))
+        with self._appListLock:
+            if self._appList is gameList:
+                self._searchIndex = index
+        return index
+
     def getApp(self, *, name: str=None, appid: str=None, caseSensitive: bool=True) -> _App:
         '''
         Returns a :class:`steamfront.app.App` of the name or app ID that was input to the function.
@@ -76,40 +284,421 @@ class Client(object):
         if appid is not None:
 
             # An app's ID was passed, get its object
-            return _App(appid)
+            return self._makeApp(appid, self._getAppPayload(appid))
         elif name is not None:
 
             # A name was passed, get its ID and then return its object
             appid = self._getIDOfApp(name, caseSensitive)
-            return _App(appid)
+            return self._makeApp(appid, self._getAppPayload(appid))
         else:
 
             # Neither was passed, raise MissingArguments
             raise _MissingArguments('Missing parameters: `name` or `appid`.')
 
-    def getUser(self, *, name: str=None, id64: str=None) -> _User:
+    def _makeApp(self, appid: str, payload: dict) -> _App:
+        '''
+        Makes an app from its payload, remembering it so that users' libraries can be filled in from it.
+        '''
+
+        if self.metrics is None:
+            app = _App.fromPayload(payload)
+        else:
+            with self.metrics.timer('construct', 'appdetails'):
+                app = _App.fromPayload(payload)
+        self._loadedApps[str(appid)] = app
+        return app
+
+    def _makeUser(self, summary: dict, ownedGames: dict) -> _User:
+        '''
+        Makes a user from their payloads.
+        '''
+
+        if self.metrics is None:
+            return _User.fromPayload(summary, ownedGames, client=self)
+        with self.metrics.timer('construct', 'user'):
+            return _User.fromPayload(summary, ownedGames, client=self)
+
+    def addHook(self, kind: str, function):
+        '''
+        Adds a function to be called around every attempt at a request made by the client, including retries.
+
+        :param str kind: Either `request`, for functions given the URL before it's sent, or `response`, for functions given the URL, the status code (or `None` if there was no response), and how many seconds it took.
+        :param Callable function: The function to call.
+        '''
+
+        if kind not in self._transport.hooks:
+            raise ValueError('The kind of hook must be either `request` or `response`.')
+        self._transport.hooks[kind].append(function)
+
+    def _getAppDetails(self, appids: list) -> dict:
+        '''
+        Gets the raw appdetails entries for a group of app IDs in one request.
+        '''
+
+        rawdata = self._transport.getJSON(_App.getGame.format(','.join(appids)))
+
+        # Steam gives back `null` for requests it won't serve in one go
+        if not isinstance(rawdata, dict):
+            return {}
+        return rawdata
+
+    def _cached(self, kind: str, key: str):
+        '''
+        Gives a value from the cache, or `None` if it has to be got from Steam. Through the prefetcher, expired values can still be given while they're refreshed.
+        '''
+
+        if self.cache is None:
+            return None
+        if self.prefetch is None:
+            return self.cache.get(kind, key)
+        return self.prefetch.access(kind, key, self.cache.getEntry(kind, key))
+
+    def _getAppPayload(self, appid: str) -> dict:
+        '''
+        Gets the raw appdetails entry for a single app.
+        '''
+
+        appid = str(appid)
+        payload = self._cached('appdetails', appid)
+        if payload is not None:
+            return payload
+        return self._fetchAppPayload(appid)
+
+    def _fetchAppPayload(self, appid: str) -> dict:
+        '''
+        Gets the raw appdetails entry for a single app from Steam, skipping the cache but updating it.
+        '''
+
+        appid = str(appid)
+        return self._flights.do(('appdetails', appid), self._requestAppPayload, appid)
+
+    def _requestAppPayload(self, appid: str) -> dict:
+        payload = self._getAppDetails([appid]).get(appid)
+        if self.cache is not None and payload is not None:
+            self.cache.set('appdetails', appid, payload)
+        return payload
+
+    def _getAppBatch(self, appids: list, checkCache: bool=True) -> dict:
+        '''
+        Gives a `dict` of app ID to either its :class:`steamfront.app.App` or the exception raised for it.
+        IDs in a group that Steam didn't answer for are left out, so that they can be asked for alone.
+        IDs that have already been looked for in the cache should be given with `checkCache` as `False`, so that each miss is only counted once.
+        '''
+
+        output = {}
+        rawdata = {}
+
+        # Anything that's cached doesn't need to be asked for
+        if self.cache is not None and checkCache:
+            for appid in appids:
+                payload = self._cached('appdetails', appid)
+                if payload is not None:
+                    rawdata[appid] = payload
+        missing = [i for i in appids if i not in rawdata]
+
+        if len(missing) > 1:
+            try:
+                fetched = self._getAppDetails(missing)
+            except Exception:
+                fetched = {}
+            for appid in missing:
+                if fetched.get(appid) is not None:
+                    rawdata[appid] = fetched[appid]
+                    if self.cache is not None:
+                        self.cache.set('appdetails', appid, fetched[appid])
+
+        for appid in appids:
+            if appid not in rawdata and len(appids) > 1:
+                continue
+            try:
+                if appid in rawdata:
+                    output[appid] = self._makeApp(appid, rawdata[appid])
+                else:
+                    output[appid] = self._makeApp(appid, self._fetchAppPayload(appid))
+            except Exception as e:
+                output[appid] = e
+        return output
+
+    def getApps(self, appids, *, concurrency: int=8, batchSize: int=1) -> dict:
+        '''
+        Gets many apps at once, making requests concurrently. An app that can't be found won't stop the others from being retrieved.
+
+        .. note::
+            Steam will only give the full details of multiple apps in one request for some filters, so by default each app is requested on its own.
+            Apps in a group that Steam doesn't answer for are requested separately.
+
+        :param appids: The IDs of the apps you want the objects of.
+        :type appids: Iterable[str]
+        :param int concurrency: The most requests to have running at once.
+        :param int batchSize: How many app IDs to put into each request.
+        :return: A `dict` of each app ID to either its :class:`steamfront.app.App` or the exception raised when getting it - usually :class:`steamfront.errors.AppNotFound`.
+        :rtype: dict
+        '''
+
+        # Remove duplicates while keeping order
+        appids = list(dict.fromkeys(str(i) for i in appids))
+        batches = [appids[i:i + batchSize] for i in range(0, len(appids), batchSize)]
+
+        # Run through each of the groups
+        output = {}
+        with _ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            for result in pool.map(self._getAppBatch, batches):
+                output.update(result)
+
+            # The endpoint didn't answer for these IDs as part of a group, so ask for each alone, still concurrently
+            unanswered = [[i] for i in appids if i not in output]
+            for result in pool.map(lambda i: self._getAppBatch(i, False), unanswered):
+                output.update(result)
+        return {i: output[i] for i in appids}
+
+    def _getPriceBatch(self, appids: list, cc: str) -> dict:
+        '''
+        Gives a `dict` of app ID to either its :class:`steamfront.price.Price`, `None`, or the exception raised for it.
+        '''
+
+        try:
+            rawdata = self._transport.getJSON(Client.appPrices.format(','.join(appids), cc))
+        except Exception as e:
+            return dict.fromkeys(appids, e)
+        if not isinstance(rawdata, dict):
+            rawdata = {}
+
+        output = {}
+        for appid in appids:
+            payload = rawdata.get(appid)
+            if not payload or not payload.get('success'):
+                output[appid] = _AppNotFound('The given app ID was not found.')
+            else:
+                output[appid] = _priceFromPayload(appid, payload)
+        return output
+
+    def getPrices(self, appids, *, cc: str='us', batchSize: int=100, concurrency: int=4) -> dict:
+        '''
+        Gets just the prices of many apps, asking for many apps in each request. This is far quicker than getting each app in full.
+        To find out how prices change over time, use a :class:`steamfront.price.PriceTracker`.
+
+        :param appids: The IDs of the apps you want the prices of.
+        :type appids: Iterable[str]
+        :param str cc: The country code of the store to get prices from.
+        :param int batchSize: How many apps to ask for in each request.
+        :param int concurrency: The most requests to have running at once.
+        :return: A `dict` of each app ID to its :class:`steamfront.price.Price`, `None` if it has no price (such as if it's free), or the exception raised when getting it - usually :class:`steamfront.errors.AppNotFound`.
+        :rtype: dict
+        '''
+
+        # Remove duplicates while keeping order
+        appids = list(dict.fromkeys(str(i) for i in appids))
+        batches = [appids[i:i + batchSize] for i in range(0, len(appids), batchSize)]
+
+        output = {}
+        with _ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            for result in pool.map(lambda i: self._getPriceBatch(i, cc), batches):
+                output.update(result)
+        return output
+
+    def _checkAPIKey(self):
+        '''
+        Raises :class:`steamfront.errors.APIKeyRequired` if the client has no API key.
+        '''
+
+        # You need an API key to get any user data
+        if self._apiKey == None:
+            raise _APIKeyRequired('An API key is required to get user information from the Steam API.')
+
+    def _getSummaries(self, id64s: list) -> dict:
+        '''
+        Gets the raw player summaries of up to 100 users in one request. Users that weren't found are left out.
+        '''
+
+        output = {}
+        if self.cache is not None:
+            for id64 in id64s:
+                summary = self._cached('summary', id64)
+                if summary is not None:
+                    output[id64] = summary
+
+        missing = tuple(i for i in id64s if i not in output)
+        if missing:
+            output.update(self._flights.do(('summary', missing), self._requestSummaries, missing))
+        return output
+
+    def _requestSummaries(self, id64s: tuple) -> dict:
+        rawdata = self._transport.getJSON(_User.getUser.format(id64=','.join(id64s), key=self._apiKey))
+        output = {}
+        for summary in rawdata['response']['players']:
+            output[summary['steamid']] = summary
+            if self.cache is not None:
+                self.cache.set('summary', summary['steamid'], summary)
+        return output
+
+    def _getOwnedGames(self, id64: str) -> dict:
+        '''
+        Gets the `response` of a user's owned games.
+        '''
+
+        ownedGames = self._cached('ownedgames', id64)
+        if ownedGames is None:
+            ownedGames = self._flights.do(('ownedgames', id64), self._requestOwnedGames, id64)
+        return ownedGames
+
+    def _requestOwnedGames(self, id64: str) -> dict:
+        rawdata = self._transport.getJSON(_User.userGames.format(id64=id64, key=self._apiKey))
+        ownedGames = rawdata['response']
+        if self.cache is not None:
+            self.cache.set('ownedgames', id64, ownedGames)
+        return ownedGames
+
+    def _iterOwnedGames(self, id64: str):
+        '''
+        Gives each of a user's owned games as it's downloaded.
+        '''
+
+        self._checkAPIKey()
+        return _iterArray(self._transport.stream(_User.userGames.format(id64=id64, key=self._apiKey)), ('response', 'games'))
+
+    def _getUserPayload(self, id64: str, apps: bool=True) -> tuple:
+        '''
+        Gets the raw player summary and owned games of a user.
+        '''
+
+        self._checkAPIKey()
+        id64 = str(id64)
+        summary = self._getSummaries([id64]).get(id64)
+        if summary is None:
+            raise _UserNotFound('The specified user could not be found.')
+        return summary, self._getOwnedGames(id64) if apps else None
+
+    def getUser(self, *, name: str=None, id64: str=None, apps: bool=True) -> _User:
         '''
         Returns a :class:`steamfront.user.User` of the name or ID64 that was input to the function.
 
         :param str id64: The ID64 of a user you want the object of.
         :param str name: The Steam ID (name) of a user you want the object of. Names are case sensitive.
+        :param bool apps: Whether to get the user's apps as well. If not, they can be gone through later with :meth:`steamfront.user.User.iterApps`.
         :return: The object of relevant data on the user.
         :rtype: :class:`steamfront.user.User`
         :raises steamfront.errors.MissingArguments: Raised if there is neither a name or an ID64 passed.
+        :raises steamfront.errors.APIKeyRequired: An API key is needed to get user information from Steam.
+        :raises steamfront.errors.UserNotFound: Raised if the user's ID64 or name is not able to be found on Steam.
         '''
 
         if id64 is not None:
 
             # A user's ID64 was passed, get its object
-            return _User(id64, apiKey=self._apiKey)
+            summary, ownedGames = self._getUserPayload(id64, apps)
+            return self._makeUser(summary, ownedGames)
 
         elif name is not None:
 
             # A user's name was passed, get its ID64 and then return its object
-            raise NotImplementedError('This is yet to be implemented. Please use an ID64.')
-            # id64 = self._getIDOfUser(name)
-            # return _User(id64, apiKey=self._apiKey)
+            id64 = self._getIDOfUser(name)
+            summary, ownedGames = self._getUserPayload(id64, apps)
+            return self._makeUser(summary, ownedGames)
         else:
 
             # Neither was passed, raise MissingArguments
             raise _MissingArguments('Missing parameters: `name` or `id64`.')
+
+    def _getIDOfUser(self, name: str) -> str:
+        '''
+        Gives the ID64 of a user whose name you have.
+        '''
+
+        self._checkAPIKey()
+
+        # Names that have been looked up lately don't need to be asked for again, whether they were found or not
+        id64 = self.nameCache.get('vanity', name)
+        if id64 is not None:
+            return id64
+        if self.nameCache.get('vanitymissing', name) is None:
+            id64 = self._flights.do(('vanity', name), self._requestIDOfUser, name)
+            if id64 is not None:
+                return id64
+
+        # No user found, raise error
+        raise _UserNotFound('The name `{}` was not found on the API. Try using an ID64.'.format(name))
+
+    def _requestIDOfUser(self, name: str) -> str:
+        rawdata = self._transport.getJSON(_User.resolveName.format(key=self._apiKey, name=_quote(name, safe='')))
+        response = rawdata.get('response') or {}
+
+        # A success of 1 is a match and 42 is no match - anything else is Steam failing to look
+        if response.get('success') == 1:
+            self.nameCache.set('vanity', name, response['steamid'])
+            return response['steamid']
+        if response.get('success') == 42:
+            self.nameCache.set('vanitymissing', name, True)
+            return None
+        raise _RequestFailed('Steam could not look up the name `{}`: {}'.format(name, response.get('message', 'no reason given')))
+
+    def resolveNames(self, names, *, concurrency: int=8) -> dict:
+        '''
+        Gets the ID64s of many users from their names at once, making requests concurrently. Names that have been looked up lately are answered from :attr:`nameCache` without a request.
+
+        :param names: The Steam IDs (names) of the users, as used in their profile URLs. Names are case sensitive.
+        :type names: Iterable[str]
+        :param int concurrency: The most requests to have running at once.
+        :return: A `dict` of each name to either its ID64 or the exception raised when looking it up - usually :class:`steamfront.errors.UserNotFound`.
+        :rtype: dict
+        :raises steamfront.errors.APIKeyRequired: An API key is needed to get user information from Steam.
+        '''
+
+        self._checkAPIKey()
+
+        # Remove duplicates while keeping order
+        names = list(dict.fromkeys(names))
+
+        def resolve(name):
+            try:
+                return self._getIDOfUser(name)
+            except Exception as e:
+                return e
+
+        with _ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            return dict(zip(names, pool.map(resolve, names)))
+
+    def getUsers(self, id64s, *, concurrency: int=8) -> dict:
+        '''
+        Gets many users at once. Player summaries are asked for 100 users at a time, and each user's games are got concurrently.
+        A user that can't be found won't stop the others from being retrieved.
+
+        :param id64s: The ID64s of the users you want the objects of.
+        :type id64s: Iterable[str]
+        :param int concurrency: The most requests to have running at once.
+        :return: A `dict` of each ID64 to either its :class:`steamfront.user.User` or the exception raised when getting it - usually :class:`steamfront.errors.UserNotFound`.
+        :rtype: dict
+        :raises steamfront.errors.APIKeyRequired: An API key is needed to get user information from Steam.
+        '''
+
+        self._checkAPIKey()
+
+        # Remove duplicates while keeping order
+        id64s = list(dict.fromkeys(str(i) for i in id64s))
+        batches = [id64s[i:i + Client.summaryBatchSize] for i in range(0, len(id64s), Client.summaryBatchSize)]
+
+        def getSummaries(batch):
+            try:
+                return batch, self._getSummaries(batch), None
+            except Exception as e:
+                return batch, {}, e
+
+        def getUser(id64, summary):
+            try:
+                return self._makeUser(summary, self._getOwnedGames(id64))
+            except Exception as e:
+                return e
+
+        output = dict.fromkeys(id64s)
+        with _ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            futures = {}
+            for batch, summaries, error in pool.map(getSummaries, batches):
+                for id64 in batch:
+                    if error is not None:
+                        output[id64] = error
+                    elif id64 not in summaries:
+                        output[id64] = _UserNotFound('The specified user could not be found.')
+                    else:
+                        futures[id64] = pool.submit(getUser, id64, summaries[id64])
+            for id64, future in futures.items():
+                output[id64] = future.result()
+        return output
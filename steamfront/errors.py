@@ -16,3 +16,13 @@ class UserNotFound(Exception):
 class APIKeyRequired(Exception):
     '''Doing this requires an API key.'''
     pass
+
+
+class RequestFailed(Exception):
+    '''A request to Steam was unsuccessful, even after being retried.'''
+    pass
+
+
+class RateLimited(RequestFailed):
+    '''Steam kept refusing requests because too many were being made.'''
+    pass
@@ -0,0 +1,217 @@
+from csv import writer as _writer
+from itertools import islice as _islice
+from os.path import splitext as _splitext
+
+
+def _get(data: dict, *keys):
+    '''
+    Gets a value from nested `dict`s, giving `None` if any part of the way is missing.
+    '''
+
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _descriptions(value) -> list:
+    if not isinstance(value, list):
+        return None
+    return [str(i.get('description')) for i in value if isinstance(i, dict)]
+
+
+def _strings(value) -> list:
+    if not isinstance(value, list):
+        return None
+    return [str(i) for i in value]
+
+
+# Each column is a name, a type, and a function getting its value from an object
+APP_COLUMNS = (
+    ('appid', 'int64', lambda i: _int(_get(i.raw, 'steam_appid'))),
+    ('name', 'string', lambda i: _get(i.raw, 'name')),
+    ('type', 'string', lambda i: _get(i.raw, 'type')),
+    ('is_free', 'bool', lambda i: _get(i.raw, 'is_free')),
+    ('required_age', 'int64', lambda i: _int(_get(i.raw, 'required_age'))),
+    ('developers', 'list<string>', lambda i: _strings(_get(i.raw, 'developers'))),
+    ('publishers', 'list<string>', lambda i: _strings(_get(i.raw, 'publishers'))),
+    ('genres', 'list<string>', lambda i: _descriptions(_get(i.raw, 'genres'))),
+    ('categories', 'list<string>', lambda i: _descriptions(_get(i.raw, 'categories'))),
+    ('windows', 'bool', lambda i: _get(i.raw, 'platforms', 'windows')),
+    ('mac', 'bool', lambda i: _get(i.raw, 'platforms', 'mac')),
+    ('linux', 'bool', lambda i: _get(i.raw, 'platforms', 'linux')),
+    ('currency', 'string', lambda i: _get(i.raw, 'price_overview', 'currency')),
+    ('price_initial', 'int64', lambda i: _int(_get(i.raw, 'price_overview', 'initial'))),
+    ('price_final', 'int64', lambda i: _int(_get(i.raw, 'price_overview', 'final'))),
+    ('discount_percent', 'int64', lambda i: _int(_get(i.raw, 'price_overview', 'discount_percent'))),
+    ('metacritic_score', 'int64', lambda i: _int(_get(i.raw, 'metacritic', 'score'))),
+    ('recommendations', 'int64', lambda i: _int(_get(i.raw, 'recommendations', 'total'))),
+    ('release_date', 'string', lambda i: _get(i.raw, 'release_date', 'date')),
+    ('coming_soon', 'bool', lambda i: _get(i.raw, 'release_date', 'coming_soon')),
+)
+
+USER_COLUMNS = (
+    ('id64', 'string', lambda i: i.id64),
+    ('name', 'string', lambda i: i.name),
+    ('profile_url', 'string', lambda i: i.profile_url),
+    ('status', 'string', lambda i: i.status),
+    ('private', 'bool', lambda i: i.private),
+    ('last_online', 'int64', lambda i: _int(i.last_online)),
+    ('app_count', 'int64', lambda i: _int(i.app_count)),
+)
+
+USERAPP_COLUMNS = (
+    ('id64', 'string', lambda i: i.player_id),
+    ('appid', 'int64', lambda i: _int(i.appid)),
+    ('playtime_forever', 'int64', lambda i: _int(i.play_time)),
+)
+
+
+def _batches(objects, columns: tuple, batchSize: int):
+    '''
+    Gives each batch of objects as a `list` of columns, each a `list` of values.
+    '''
+
+    objects = iter(objects)
+    while True:
+        batch = list(_islice(objects, batchSize))
+        if not batch:
+            return
+        yield [[getter(i) for i in batch] for _, _, getter in columns]
+
+
+def _arrowSchema(columns: tuple):
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError('pyarrow is required to export to Parquet or Arrow files.')
+
+    types = {
+        'int64': pyarrow.int64(),
+        'string': pyarrow.string(),
+        'bool': pyarrow.bool_(),
+        'list<string>': pyarrow.list_(pyarrow.string()),
+    }
+    return pyarrow, pyarrow.schema([(name, types[kind]) for name, kind, _ in columns])
+
+
+def _recordBatch(pyarrow, batch: list, schema):
+    arrays = [pyarrow.array(values, type=field.type) for values, field in zip(batch, schema)]
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _writeCSV(batches, columns: tuple, path: str) -> int:
+    rows = 0
+    with open(path, 'w', newline='', encoding='utf-8') as a:
+        output = _writer(a)
+        output.writerow([name for name, _, _ in columns])
+        for batch in batches:
+            # Lists are joined up, since CSV has no way to hold them
+            for index, (_, kind, _) in enumerate(columns):
+                if kind == 'list<string>':
+                    batch[index] = [None if i is None else '|'.join(i) for i in batch[index]]
+            output.writerows(zip(*batch))
+            rows += len(batch[0])
+    return rows
+
+
+def _writeParquet(batches, columns: tuple, path: str) -> int:
+    pyarrow, schema = _arrowSchema(columns)
+    import pyarrow.parquet
+
+    rows = 0
+    with pyarrow.parquet.ParquetWriter(path, schema) as output:
+        for batch in batches:
+            output.write_batch(_recordBatch(pyarrow, batch, schema))
+            rows += len(batch[0])
+    return rows
+
+
+def _writeArrow(batches, columns: tuple, path: str) -> int:
+    pyarrow, schema = _arrowSchema(columns)
+    import pyarrow.ipc
+
+    rows = 0
+    with pyarrow.OSFile(path, 'wb') as sink, pyarrow.ipc.new_file(sink, schema) as output:
+        for batch in batches:
+            output.write_batch(_recordBatch(pyarrow, batch, schema))
+            rows += len(batch[0])
+    return rows
+
+
+_writers = {
+    'csv': _writeCSV,
+    'parquet': _writeParquet,
+    'arrow': _writeArrow,
+}
+
+
+def _export(objects, columns: tuple, path: str, format: str, batchSize: int) -> int:
+    if format is None:
+        format = {'.csv': 'csv', '.parquet': 'parquet', '.arrow': 'arrow', '.feather': 'arrow'}.get(_splitext(path)[1].lower())
+    if format not in _writers:
+        raise ValueError('The export format must be one of `csv`, `parquet`, or `arrow`.')
+    return _writers[format](_batches(objects, columns, batchSize), columns, path)
+
+
+def exportApps(apps, path: str, *, format: str=None, batchSize: int=10000) -> int:
+    '''
+    Writes apps to a file with one row per app and the columns in :data:`APP_COLUMNS`.
+    Apps are read and written a batch at a time, so they can come from a generator without all being held in memory.
+    Parquet and Arrow files need `pyarrow` to be installed.
+
+    :param apps: The apps to write.
+    :type apps: Iterable[steamfront.app.App]
+    :param str path: The path of the file.
+    :param format: One of `csv`, `parquet`, or `arrow`. Worked out from the file's extension if not given.
+    :type format: Optional[str]
+    :param int batchSize: How many apps are written at a time.
+    :return: The number of rows written.
+    :rtype: int
+    '''
+
+    return _export(apps, APP_COLUMNS, path, format, batchSize)
+
+
+def exportUsers(users, path: str, *, format: str=None, batchSize: int=10000) -> int:
+    '''
+    Writes users to a file with one row per user and the columns in :data:`USER_COLUMNS`.
+    Works in the same way as :func:`steamfront.export.exportApps`.
+
+    :param users: The users to write.
+    :type users: Iterable[steamfront.user.User]
+    :param str path: The path of the file.
+    :param format: One of `csv`, `parquet`, or `arrow`. Worked out from the file's extension if not given.
+    :type format: Optional[str]
+    :param int batchSize: How many users are written at a time.
+    :return: The number of rows written.
+    :rtype: int
+    '''
+
+    return _export(users, USER_COLUMNS, path, format, batchSize)
+
+
+def exportUserApps(userApps, path: str, *, format: str=None, batchSize: int=10000) -> int:
+    '''
+    Writes the apps in users' libraries to a file with one row per user and app, and the columns in :data:`USERAPP_COLUMNS`.
+    Works in the same way as :func:`steamfront.export.exportApps`. Apps don't need to be unlazified first.
+
+    :param userApps: The apps to write, such as from :attr:`steamfront.user.User.apps` or :meth:`steamfront.user.User.iterApps`.
+    :type userApps: Iterable[steamfront.userapp.UserApp]
+    :param str path: The path of the file.
+    :param format: One of `csv`, `parquet`, or `arrow`. Worked out from the file's extension if not given.
+    :type format: Optional[str]
+    :param int batchSize: How many rows are written at a time.
+    :return: The number of rows written.
+    :rtype: int
+    '''
+
+    return _export(userApps, USERAPP_COLUMNS, path, format, batchSize)
@@ -0,0 +1,131 @@
+from codecs import getincrementaldecoder as _getincrementaldecoder
+from json import JSONDecoder as _JSONDecoder
+
+
+_decoder = _JSONDecoder()
+_whitespace = ' \t\n\r'
+_numeric = frozenset('0123456789.eE+-')
+
+
+class _Reader(object):
+    '''
+    Reads JSON values one at a time from a stream of bytes, only holding on to what hasn't been read yet.
+    '''
+
+    def __init__(self, chunks):
+
+        self._chunks = iter(chunks)
+        self._text = _getincrementaldecoder('utf-8')()
+        self._done = False
+        self.buffer = ''
+        self.position = 0
+
+    def more(self) -> bool:
+        '''
+        Adds the next chunk of the stream to the buffer, dropping everything that's been read. Gives whether there was anything to add.
+        '''
+
+        for chunk in self._chunks:
+            text = self._text.decode(chunk)
+            if text:
+                self.buffer = self.buffer[self.position:] + text
+                self.position = 0
+                return True
+
+        if not self._done:
+            self._done = True
+            text = self._text.decode(b'', final=True)
+            if text:
+                self.buffer = self.buffer[self.position:] + text
+                self.position = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        '''
+        Gives the next character that isn't whitespace without reading it, or an empty string at the end of the stream.
+        '''
+
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in _whitespace:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.more():
+                return ''
+
+    def expect(self, character: str):
+        '''
+        Reads the next character, making sure it's the one given.
+        '''
+
+        found = self.peek()
+        if found != character:
+            raise ValueError('Expected {!r} in the JSON stream but found {!r}.'.format(character, found))
+        self.position += 1
+
+    def value(self):
+        '''
+        Reads the next whole JSON value.
+        '''
+
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.position)
+            except ValueError:
+                if self.more():
+                    continue
+                raise
+
+            # A number with nothing but number characters after it might carry on into the next chunk, such as `1.` before `5`
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                following = end
+                while following < len(self.buffer) and self.buffer[following] in _numeric:
+                    following += 1
+                if following == len(self.buffer) and self.more():
+                    continue
+            self.position = end
+            return value
+
+
+def iterArray(chunks, path: tuple):
+    '''
+    Gives each item of an array inside a JSON document as soon as it has been read, without reading the whole document into memory first.
+    Nothing is given if the path isn't in the document.
+
+    :param chunks: The document as chunks of UTF-8 bytes, such as from :meth:`requests.Response.iter_content`.
+    :type chunks: Iterable[bytes]
+    :param tuple path: The keys of the objects the array is inside of, outermost first.
+    :return: A generator of the items in the array.
+    :raises ValueError: Raised if the document isn't valid JSON.
+    '''
+
+    reader = _Reader(chunks)
+
+    # Find the array, skipping over anything that isn't on the way to it
+    for key in path:
+        reader.expect('{')
+        while True:
+            if reader.peek() == '}':
+                return
+            found = reader.value()
+            reader.expect(':')
+            if found == key:
+                break
+            reader.value()
+            if reader.peek() == ',':
+                reader.position += 1
+
+    # Give back each of the array's items
+    reader.expect('[')
+    if reader.peek() == ']':
+        return
+    while True:
+        yield reader.value()
+        following = reader.peek()
+        reader.position += 1
+        if following == ']':
+            return
+        if following != ',':
+            raise ValueError('Expected \',\' or \']\' in the JSON stream but found {!r}.'.format(following))
@@ -0,0 +1,199 @@
+from bisect import bisect_left as _bisect_left
+from contextlib import contextmanager as _contextmanager
+from threading import Lock as _Lock
+from time import perf_counter as _perf_counter
+from urllib.parse import urlsplit as _urlsplit
+
+
+def endpointOf(url: str) -> str:
+    '''
+    Gives a short name for the endpoint a URL is for, such as `appdetails` or `GetPlayerSummaries`.
+
+    :param str url: The URL.
+    :rtype: str
+    '''
+
+    parts = [i for i in _urlsplit(url).path.split('/') if i]
+    if len(parts) > 1 and parts[-1][:1] == 'v' and parts[-1][1:].isdigit():
+        parts.pop()
+    return parts[-1] if parts else _urlsplit(url).netloc
+
+
+class Histogram(object):
+    '''
+    Counts how many observed values fall into each of a set of buckets, in the same way as a Prometheus histogram.
+
+    :param tuple buckets: The upper bound of each bucket, smallest first.
+    '''
+
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, buckets: tuple=None):
+
+        self.buckets = tuple(buckets or Histogram.BUCKETS)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        '''
+        Adds a value to the histogram.
+        '''
+
+        self.counts[_bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        '''
+        Gives a `list` of `(upper bound, count)` tuples, where each count includes every smaller bucket. The last bound is infinity.
+        '''
+
+        output, total = [], 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            output.append((bound, total))
+        return output
+
+
+class Metrics(object):
+    '''
+    Counts requests, bytes, status codes, retries, and cache hits for each endpoint, and times each stage of getting data.
+    The stages timed are `network` (making the request and reading the response), `decode` (turning JSON into Python), and `construct` (making objects from the data).
+    Streamed responses, such as the list of apps, are decoded while they're read, so their `decode` time includes their `network` time.
+
+    Give one to a :class:`steamfront.client.Client` with its `metrics` parameter, then export it with :meth:`prometheus` or :meth:`statsd`.
+
+    :param tuple buckets: The upper bounds of the buckets for every timing histogram, in seconds.
+    '''
+
+    def __init__(self, *, buckets: tuple=None):
+
+        self._buckets = buckets
+        self._lock = _Lock()
+        self.requests = {}  # endpoint -> {status -> count}
+        self.bytes = {}  # endpoint -> count
+        self.retries = {}  # endpoint -> count
+        self.cache = {}  # (kind, result) -> count
+        self.timings = {}  # (stage, endpoint) -> Histogram
+
+    def recordRequest(self, endpoint: str, status, size: int):
+        '''
+        Counts a request that's been made, along with its status code and the size of its body.
+        Requests that failed without a response should be given a status of `error`.
+        '''
+
+        with self._lock:
+            statuses = self.requests.setdefault(endpoint, {})
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+            self.bytes[endpoint] = self.bytes.get(endpoint, 0) + size
+
+    def recordBytes(self, endpoint: str, size: int):
+        '''
+        Counts bytes read from a response after it was first counted, such as when it's streamed.
+        '''
+
+        with self._lock:
+            self.bytes[endpoint] = self.bytes.get(endpoint, 0) + size
+
+    def recordRetry(self, endpoint: str):
+        '''
+        Counts a request being retried.
+        '''
+
+        with self._lock:
+            self.retries[endpoint] = self.retries.get(endpoint, 0) + 1
+
+    def recordCache(self, kind: str, hit: bool):
+        '''
+        Counts a lookup in the response cache.
+        '''
+
+        key = (kind, 'hit' if hit else 'miss')
+        with self._lock:
+            self.cache[key] = self.cache.get(key, 0) + 1
+
+    def observe(self, stage: str, endpoint: str, seconds: float):
+        '''
+        Adds how long a stage took to that stage's histogram.
+        '''
+
+        with self._lock:
+            histogram = self.timings.get((stage, endpoint))
+            if histogram is None:
+                histogram = self.timings[(stage, endpoint)] = Histogram(self._buckets)
+            histogram.observe(seconds)
+
+    @_contextmanager
+    def timer(self, stage: str, endpoint: str):
+        '''
+        Times the code inside of a ``with`` block as a stage.
+        '''
+
+        start = _perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, endpoint, _perf_counter() - start)
+
+    def prometheus(self, *, prefix: str='steamfront') -> str:
+        '''
+        Gives everything in the Prometheus text format, ready to be served from a `/metrics` page.
+
+        :param str prefix: What to start the name of each metric with.
+        :rtype: str
+        '''
+
+        lines = []
+        with self._lock:
+            lines.append('# TYPE {}_requests_total counter'.format(prefix))
+            for endpoint, statuses in sorted(self.requests.items()):
+                for status, count in sorted(statuses.items()):
+                    lines.append('{}_requests_total{{endpoint="{}",status="{}"}} {}'.format(prefix, endpoint, status, count))
+
+            lines.append('# TYPE {}_response_bytes_total counter'.format(prefix))
+            for endpoint, count in sorted(self.bytes.items()):
+                lines.append('{}_response_bytes_total{{endpoint="{}"}} {}'.format(prefix, endpoint, count))
+
+            lines.append('# TYPE {}_retries_total counter'.format(prefix))
+            for endpoint, count in sorted(self.retries.items()):
+                lines.append('{}_retries_total{{endpoint="{}"}} {}'.format(prefix, endpoint, count))
+
+            lines.append('# TYPE {}_cache_lookups_total counter'.format(prefix))
+            for (kind, result), count in sorted(self.cache.items()):
+                lines.append('{}_cache_lookups_total{{kind="{}",result="{}"}} {}'.format(prefix, kind, result, count))
+
+            lines.append('# TYPE {}_seconds histogram'.format(prefix))
+            for (stage, endpoint), histogram in sorted(self.timings.items()):
+                labels = 'stage="{}",endpoint="{}"'.format(stage, endpoint)
+                for bound, count in histogram.cumulative():
+                    bound = '+Inf' if bound == float('inf') else repr(float(bound))
+                    lines.append('{}_seconds_bucket{{{},le="{}"}} {}'.format(prefix, labels, bound, count))
+                lines.append('{}_seconds_sum{{{}}} {}'.format(prefix, labels, histogram.sum))
+                lines.append('{}_seconds_count{{{}}} {}'.format(prefix, labels, histogram.count))
+        return '\n'.join(lines) + '\n'
+
+    def statsd(self, *, prefix: str='steamfront') -> list:
+        '''
+        Gives everything as StatsD gauge lines, ready to be sent to a StatsD server. Counts are running totals, and timings are given as their count and mean in milliseconds.
+
+        :param str prefix: What to start the name of each metric with.
+        :rtype: list
+        '''
+
+        lines = []
+        with self._lock:
+            for endpoint, statuses in sorted(self.requests.items()):
+                for status, count in sorted(statuses.items()):
+                    lines.append('{}.requests.{}.{}:{}|g'.format(prefix, endpoint, status, count))
+            for endpoint, count in sorted(self.bytes.items()):
+                lines.append('{}.bytes.{}:{}|g'.format(prefix, endpoint, count))
+            for endpoint, count in sorted(self.retries.items()):
+                lines.append('{}.retries.{}:{}|g'.format(prefix, endpoint, count))
+            for (kind, result), count in sorted(self.cache.items()):
+                lines.append('{}.cache.{}.{}:{}|g'.format(prefix, kind, result, count))
+            for (stage, endpoint), histogram in sorted(self.timings.items()):
+                mean = histogram.sum / histogram.count * 1000 if histogram.count else 0
+                lines.append('{}.timing.{}.{}.count:{}|g'.format(prefix, stage, endpoint, histogram.count))
+                lines.append('{}.timing.{}.{}.mean_ms:{:.3f}|g'.format(prefix, stage, endpoint, mean))
+        return lines
@@ -0,0 +1,209 @@
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from threading import Event as _Event
+from threading import Lock as _Lock
+from threading import Thread as _Thread
+from time import time as _time
+from .ratelimit import TokenBucket as _TokenBucket
+
+
+class PrefetchScheduler(object):
+    '''
+    Keeps often used entries in a :class:`steamfront.client.Client`'s response cache fresh, so that getting them rarely has to wait on Steam.
+
+    Every time the client reads an app's details or a user's data from its cache, the scheduler counts it. Entries that are read often enough are hot.
+    Hot entries are refreshed on a pool of background threads shortly before they expire, both when they're read and by a sweep every so often.
+    Any entry that has expired, hot or not, is still given back for a while after, and is refreshed in the background at the same time - this is stale-while-revalidate.
+    Every refresh takes a token from one bucket first, so the scheduler never makes more than its budget of requests, however much is hot.
+
+    Give one to a :class:`steamfront.client.Client` with its `prefetch` parameter.
+
+    :param int workers: How many refreshes can run at once.
+    :param tuple budget: The most refreshes to make, as a tuple of `(calls, period)` where `period` is in seconds.
+    :param float refreshAhead: How early to refresh a hot entry, as a fraction of its time to live. `0.2` refreshes an entry that's kept for an hour 12 minutes before it expires.
+    :param float staleFor: How long, in seconds, an entry is still given back for after it expires.
+    :param float minScore: How many reads an entry needs, within about `halfLife` seconds, to be hot.
+    :param float halfLife: How long, in seconds, it takes for a read to count half as much.
+    :param float sweepEvery: How often, in seconds, hot entries are checked for being close to expiring.
+    :param int maxTracked: The most entries to count reads for. The least read are forgotten first.
+    :param int maxPending: The most refreshes that can be waiting to run. Any more are dropped until there's room.
+    :ivar refreshers: A `dict` of each kind of data to a function that gets that kind of data from Steam and caches it, given the data's key. Set by the client.
+    :ivar ttls: A `dict` of each kind of data to how long, in seconds, it's cached for. Set by the client from its cache.
+    :ivar stats: A `dict` with the number of refreshes `scheduled`, `dropped` (because too many were waiting), `done`, and `failed`.
+    '''
+
+    def __init__(self, *, workers: int=4, budget: tuple=(60, 60), refreshAhead: float=0.2, staleFor: float=3600, minScore: float=3,
+            halfLife: float=600, sweepEvery: float=30, maxTracked: int=10000, maxPending: int=1000):
+
+        self.refreshAhead = refreshAhead
+        self.staleFor = staleFor
+        self.minScore = minScore
+        self.halfLife = halfLife
+        self.sweepEvery = sweepEvery
+        self.maxTracked = maxTracked
+        self.maxPending = maxPending
+        self.refreshers = {}
+        self.ttls = {}
+        self.stats = {'scheduled': 0, 'dropped': 0, 'done': 0, 'failed': 0}
+        self._budget = _TokenBucket(*budget, burst=max(1, workers))
+        self._pool = _ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='steamfront-prefetch')
+        self._lock = _Lock()
+        self._tracked = {}  # (kind, key) -> [score, last read, expires]
+        self._pending = set()
+        self._closed = _Event()
+        self._sweeper = None
+
+    def _score(self, entry: list, now: float) -> float:
+        return entry[0] * 0.5 ** ((now - entry[1]) / self.halfLife)
+
+    def access(self, kind: str, key: str, entry: tuple):
+        '''
+        Counts a read of the cache, and gives back the value that should be used for it.
+
+        :param str kind: The kind of data.
+        :param str key: The key of the data.
+        :param entry: What was in the cache, as a tuple of `(expires, value)`, or `None`.
+        :return: The cached value, or `None` if it needs to be got from Steam now.
+        '''
+
+        now = _time()
+        expires = entry[0] if entry is not None else None
+        with self._lock:
+            tracked = self._tracked.get((kind, key))
+            if tracked is None:
+                tracked = self._tracked[(kind, key)] = [0.0, now, expires]
+                if len(self._tracked) > self.maxTracked:
+                    self._forget(now)
+            tracked[0] = self._score(tracked, now) + 1
+            tracked[1] = now
+            tracked[2] = expires
+            hot = tracked[0] >= self.minScore
+        self._startSweeper()
+
+        if entry is None:
+            return None
+
+        # Fresh entries are used as they are, but hot ones are refreshed if they're about to expire
+        if expires > now:
+            if hot and expires - now <= self.refreshAhead * self.ttls.get(kind, 0):
+                self.schedule(kind, key)
+            return entry[1]
+
+        # Expired entries are used while they're refreshed, unless they're too old
+        if now - expires <= self.staleFor:
+            self.schedule(kind, key)
+            return entry[1]
+        return None
+
+    def _forget(self, now: float):
+        '''
+        Forgets the least read half of the tracked entries.
+        '''
+
+        scores = sorted(self._tracked.items(), key=lambda i: self._score(i[1], now))
+        for key, _ in scores[:len(scores) // 2]:
+            del self._tracked[key]
+
+    def schedule(self, kind: str, key: str) -> bool:
+        '''
+        Asks for an entry to be refreshed in the background. An entry that's already waiting to be refreshed isn't asked for twice.
+
+        :param str kind: The kind of data.
+        :param str key: The key of the data.
+        :return: Whether the refresh was scheduled.
+        :rtype: bool
+        '''
+
+        if kind not in self.refreshers or self._closed.is_set():
+            return False
+        with self._lock:
+            if (kind, key) in self._pending:
+                return False
+            if len(self._pending) >= self.maxPending:
+                self.stats['dropped'] += 1
+                return False
+            self._pending.add((kind, key))
+            self.stats['scheduled'] += 1
+        try:
+            self._pool.submit(self._refresh, kind, key)
+        except RuntimeError:
+            # The pool was shut down in the meantime
+            with self._lock:
+                self._pending.discard((kind, key))
+            return False
+        return True
+
+    def _refresh(self, kind: str, key: str):
+        try:
+            # Closing stops a refresh that's still waiting for its token, rather than leaving it to wait out the budget
+            if not self._budget.acquire(cancel=self._closed):
+                return
+            self.refreshers[kind](key)
+            stat = 'done'
+        except Exception:
+            stat = 'failed'
+        finally:
+            with self._lock:
+                self._pending.discard((kind, key))
+
+        with self._lock:
+            self.stats[stat] += 1
+
+            # The entry was just cached again, so it won't need refreshing until it's close to expiring again
+            tracked = self._tracked.get((kind, key))
+            if tracked is not None and stat == 'done':
+                tracked[2] = _time() + self.ttls.get(kind, 0)
+
+    def hot(self) -> list:
+        '''
+        Gives the entries that are hot right now.
+
+        :return: A `list` of `(kind, key)` tuples, most read first.
+        :rtype: list
+        '''
+
+        now = _time()
+        with self._lock:
+            scored = [(self._score(v, now), k) for k, v in self._tracked.items()]
+        return [k for score, k in sorted(scored, reverse=True) if score >= self.minScore]
+
+    def sweep(self) -> int:
+        '''
+        Schedules a refresh of every hot entry that's close to expiring, or has expired. This is done by itself every `sweepEvery` seconds.
+
+        :return: The number of refreshes scheduled.
+        :rtype: int
+        '''
+
+        now = _time()
+        due = []
+        with self._lock:
+            for (kind, key), tracked in self._tracked.items():
+                expires = tracked[2]
+                if expires is None or self._score(tracked, now) < self.minScore:
+                    continue
+                if expires - now <= self.refreshAhead * self.ttls.get(kind, 0):
+                    due.append((kind, key))
+        return sum(self.schedule(kind, key) for kind, key in due)
+
+    def _startSweeper(self):
+        if self._sweeper is not None or self._closed.is_set():
+            return
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = _Thread(target=self._sweepForever, name='steamfront-prefetch-sweep', daemon=True)
+        self._sweeper.start()
+
+    def _sweepForever(self):
+        while not self._closed.wait(self.sweepEvery):
+            self.sweep()
+
+    def close(self):
+        '''
+        Stops the scheduler. Refreshes that are waiting are dropped, and ones that are running are left to finish.
+        '''
+
+        self._closed.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._pending.clear()
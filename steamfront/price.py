@@ -0,0 +1,81 @@
+from collections import namedtuple as _namedtuple
+from threading import Lock as _Lock
+
+
+Price = _namedtuple('Price', 'appid currency initial final discount_percent')
+Price.__doc__ = '''
+The price of an app in one country. `initial` and `final` are in the smallest unit of the currency, such as cents.
+'''
+
+PriceChange = _namedtuple('PriceChange', 'appid old new')
+PriceChange.__doc__ = '''
+A change in the price of an app between two polls. `old` and `new` are each a :class:`steamfront.price.Price`, or `None` if the app had no price.
+'''
+
+
+def priceFromPayload(appid: str, payload: dict) -> Price:
+    '''
+    Makes a :class:`steamfront.price.Price` from an app's entry in a `price_overview` filtered appdetails response, or gives `None` if the app has no price, such as if it's free.
+
+    :param str appid: The ID of the app.
+    :param dict payload: The app's entry in the response.
+    :rtype: Optional[steamfront.price.Price]
+    '''
+
+    # Steam gives an empty list instead of a dict when there's no price
+    data = payload.get('data')
+    if not isinstance(data, dict) or 'price_overview' not in data:
+        return None
+    overview = data['price_overview']
+    return Price(str(appid), overview['currency'], overview['initial'], overview['final'], overview['discount_percent'])
+
+
+class PriceTracker(object):
+    '''
+    Polls the prices of apps, keeping the last price of each so that changes between polls can be found.
+
+    :param steamfront.client.Client client: The client to get prices through.
+    :param str cc: The country code of the store to get prices from.
+    :param int batchSize: How many apps to ask for in each request.
+    :param int concurrency: The most requests to have running at once.
+    :param onChange: A function to be called with each :class:`steamfront.price.PriceChange` as it's found.
+    :type onChange: Optional[Callable]
+    :ivar prices: A `dict` of app ID to the last :class:`steamfront.price.Price` seen for it, or `None` if it had no price.
+    '''
+
+    def __init__(self, client, cc: str='us', *, batchSize: int=100, concurrency: int=4, onChange=None):
+
+        self.client = client
+        self.cc = cc
+        self.batchSize = batchSize
+        self.concurrency = concurrency
+        self.onChange = onChange
+        self.prices = {}
+        self._lock = _Lock()
+
+    def poll(self, appids) -> list:
+        '''
+        Gets the current prices of apps, and gives back how they've changed since the last poll.
+        Apps seen for the first time aren't counted as changing, and apps whose price couldn't be got are left as they were.
+
+        :param appids: The IDs of the apps to poll.
+        :type appids: Iterable[str]
+        :return: A `list` of :class:`steamfront.price.PriceChange`.
+        :rtype: list
+        '''
+
+        current = self.client.getPrices(appids, cc=self.cc, batchSize=self.batchSize, concurrency=self.concurrency)
+
+        changes = []
+        with self._lock:
+            for appid, price in current.items():
+                if isinstance(price, Exception):
+                    continue
+                if appid in self.prices and self.prices[appid] != price:
+                    changes.append(PriceChange(appid, self.prices[appid], price))
+                self.prices[appid] = price
+
+        if self.onChange is not None:
+            for change in changes:
+                self.onChange(change)
+        return changes
@@ -0,0 +1,87 @@
+from threading import Event as _Event
+from threading import Lock as _Lock
+from time import monotonic as _monotonic
+from time import sleep as _sleep
+from urllib.parse import urlsplit as _urlsplit
+
+
+class TokenBucket(object):
+    '''
+    A thread-safe token bucket, allowing a number of calls within a period of time.
+    Calls can be made in a burst until the bucket is empty, after which they're spread evenly across the period.
+
+    :param int calls: How many calls are allowed in each period.
+    :param float period: The length of the period in seconds.
+    :param burst: How many calls can be made at once. Defaults to the value of `calls`.
+    :type burst: Optional[int]
+    '''
+
+    def __init__(self, calls: int, period: float, *, burst: int=None):
+
+        self.rate = calls / period
+        self.capacity = burst if burst is not None else calls
+        self._tokens = float(self.capacity)
+        self._updated = _monotonic()
+        self._lock = _Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, *, cancel: _Event=None) -> bool:
+        '''
+        Takes a token from the bucket, waiting until one is available.
+
+        :param cancel: An event that stops the wait as soon as it's set, without taking a token.
+        :type cancel: Optional[threading.Event]
+        :return: Whether a token was taken - only `False` if `cancel` was set.
+        :rtype: bool
+        '''
+
+        while True:
+            if cancel is not None and cancel.is_set():
+                return False
+            with self._lock:
+                self._refill(_monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if cancel is None:
+                _sleep(wait)
+            else:
+                cancel.wait(wait)
+
+
+class RateLimiter(object):
+    '''
+    Keeps a :class:`steamfront.ratelimit.TokenBucket` for each endpoint, and makes requests wait for their endpoint's bucket.
+
+    :param dict limits: A `dict` of URL prefix (without the scheme, eg ``'api.steampowered.com'``) to a tuple of `(calls, period)`. The longest matching prefix is used for each URL, and URLs with no match aren't limited.
+    '''
+
+    def __init__(self, limits: dict):
+
+        self._buckets = [(prefix, TokenBucket(calls, period)) for prefix, (calls, period) in limits.items()]
+        self._buckets.sort(key=lambda i: len(i[0]), reverse=True)
+
+    def bucketFor(self, url: str) -> TokenBucket:
+        '''
+        Gives the bucket that a URL falls under, or `None` if it isn't limited.
+        '''
+
+        parts = _urlsplit(url)
+        location = parts.netloc + parts.path
+        for prefix, bucket in self._buckets:
+            if location.startswith(prefix):
+                return bucket
+        return None
+
+    def acquire(self, url: str):
+        '''
+        Waits until a request to the given URL is allowed.
+        '''
+
+        bucket = self.bucketFor(url)
+        if bucket is not None:
+            bucket.acquire()
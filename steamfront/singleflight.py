@@ -0,0 +1,66 @@
+from threading import Event as _Event
+from threading import Lock as _Lock
+
+
+class _Call(object):
+    '''
+    A call that's running, which other threads can wait on the result of.
+    '''
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+
+        self.done = _Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    '''
+    Makes sure only one call for each key runs at a time. Threads asking for a key that's already being called for wait for that call and share its result, rather than making their own.
+    Nothing is kept once a call has finished, so a later call for the same key runs again.
+    '''
+
+    def __init__(self):
+
+        self._lock = _Lock()
+        self._calls = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    def do(self, key, function, *args):
+        '''
+        Calls a function, or waits for the call already running under the same key.
+
+        :param key: What the call is for, such as ``('appdetails', '440')``. Must be hashable.
+        :param Callable function: The function to call.
+        :param args: The arguments to call the function with.
+        :return: Whatever the function gave back.
+        :raises Exception: Whatever the function raised, in every thread that waited for it.
+        '''
+
+        with self._lock:
+            call = self._calls.get(key)
+            running = call is not None
+            if not running:
+                call = self._calls[key] = _Call()
+
+        # Someone else is already doing this, so wait for them
+        if running:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,155 @@
+from collections import namedtuple as _namedtuple
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from concurrent.futures import as_completed as _as_completed
+from hashlib import blake2b as _blake2b
+from json import dumps as _dumps
+from os import makedirs as _makedirs
+from os.path import dirname as _dirname
+from time import time as _time
+
+
+SyncResult = _namedtuple('SyncResult', 'added removed renamed changed unchanged failed')
+SyncResult.__doc__ = '''
+The changes found by a run of :meth:`steamfront.sync.CatalogueSync.run`. Each is a `list` of app IDs, apart from `failed`, which is a `dict` of app ID to the exception raised when getting it.
+`added`, `removed`, and `renamed` come from the app list. `changed` and `unchanged` are the apps whose details were got again, split by whether they were different to last time.
+'''
+
+
+def hashPayload(payload) -> str:
+    '''
+    Gives a hash of an app's appdetails entry that only changes when the entry's content does.
+
+    :param payload: The app's entry in an appdetails response.
+    :rtype: str
+    '''
+
+    data = _dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return _blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class CatalogueSync(object):
+    '''
+    Keeps a snapshot of every app on Steam, with a hash of each app's details, so that each sync only has to get the details of apps that are new or out of date.
+    The snapshot is kept in an SQLite database, so that it lasts between runs.
+
+    :param steamfront.client.Client client: The client to get the app list and apps through.
+    :param str path: The path of the snapshot's database file.
+    :param float maxAge: How long, in seconds, an app's details are trusted for before they're got again.
+    :param int concurrency: The most requests to have running at once.
+    '''
+
+    def __init__(self, client, path: str, *, maxAge: float=7 * 86400, concurrency: int=8):
+
+        import sqlite3
+
+        if _dirname(path):
+            _makedirs(_dirname(path), exist_ok=True)
+        self.client = client
+        self.maxAge = maxAge
+        self.concurrency = concurrency
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS apps (appid INTEGER PRIMARY KEY, name TEXT, hash TEXT, fetched REAL)')
+        self._db.commit()
+
+    def close(self):
+        '''
+        Closes the snapshot's database.
+        '''
+
+        self._db.close()
+
+    def snapshot(self) -> dict:
+        '''
+        Gives the snapshot as a `dict` of app ID to a tuple of `(name, hash, fetched)`, where `hash` and `fetched` are `None` for apps whose details haven't been got yet.
+
+        :rtype: dict
+        '''
+
+        return {str(i[0]): i[1:] for i in self._db.execute('SELECT appid, name, hash, fetched FROM apps')}
+
+    def _updateList(self, snapshot: dict) -> tuple:
+        '''
+        Brings the snapshot in line with a new app list, giving back the apps that were added, removed, and renamed.
+        '''
+
+        added, renamed = [], []
+        seen = set()
+        for appid, name in self.client._getGamesFromSteam():
+            appid = str(appid)
+            if appid in seen:
+                continue
+            seen.add(appid)
+            if appid not in snapshot:
+                added.append(appid)
+                snapshot[appid] = (name, None, None)
+                self._db.execute('INSERT INTO apps VALUES (?, ?, NULL, NULL)', (int(appid), name))
+            elif snapshot[appid][0] != name:
+                renamed.append(appid)
+                snapshot[appid] = (name,) + snapshot[appid][1:]
+                self._db.execute('UPDATE apps SET name = ? WHERE appid = ?', (name, int(appid)))
+
+        removed = [i for i in snapshot if i not in seen]
+        for appid in removed:
+            del snapshot[appid]
+            self._db.execute('DELETE FROM apps WHERE appid = ?', (int(appid),))
+        self._db.commit()
+        return added, removed, renamed
+
+    def due(self, snapshot: dict=None) -> list:
+        '''
+        Gives the IDs of the apps whose details need getting, oldest first, with apps that have never been got at the front.
+
+        :param snapshot: The snapshot to look through. Defaults to the one on disk.
+        :type snapshot: Optional[dict]
+        :rtype: list
+        '''
+
+        snapshot = self.snapshot() if snapshot is None else snapshot
+        cutoff = _time() - self.maxAge
+        due = [(entry[2] or 0, appid) for appid, entry in snapshot.items() if entry[2] is None or entry[2] < cutoff]
+        due.sort()
+        return [appid for _, appid in due]
+
+    def run(self, *, limit: int=None, progress=None) -> SyncResult:
+        '''
+        Gets the newest app list, works out what's changed in it, and then gets the details of the apps that are new or out of date.
+        Details are saved as they come in, so a run that's stopped part way through loses very little.
+
+        :param limit: The most apps to get the details of, taking the oldest first. Everything that's due is got if this isn't given.
+        :type limit: Optional[int]
+        :param progress: A function to be called after each app is done with, given the number of apps done, the total number of apps, and the app's ID.
+        :type progress: Optional[Callable]
+        :return: Everything that was found to have changed.
+        :rtype: :class:`steamfront.sync.SyncResult`
+        '''
+
+        snapshot = self.snapshot()
+        added, removed, renamed = self._updateList(snapshot)
+        due = self.due(snapshot)
+        if limit is not None:
+            due = due[:limit]
+
+        changed, unchanged, failed = [], [], {}
+        with _ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as pool:
+            futures = {pool.submit(self.client._fetchAppPayload, i): i for i in due}
+            for done, future in enumerate(_as_completed(futures), 1):
+                appid = futures[future]
+                try:
+                    payload = future.result()
+                except Exception as e:
+                    failed[appid] = e
+                else:
+                    digest = hashPayload(payload)
+                    previous = snapshot[appid][1]
+                    if previous is not None:
+                        (unchanged if previous == digest else changed).append(appid)
+                    self._db.execute('UPDATE apps SET hash = ?, fetched = ? WHERE appid = ?', (digest, _time(), int(appid)))
+
+                # Save every so often
+                if done % 100 == 0:
+                    self._db.commit()
+                if progress is not None:
+                    progress(done, len(due), appid)
+        self._db.commit()
+
+        return SyncResult(added, removed, renamed, changed, unchanged, failed)
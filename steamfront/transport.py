@@ -0,0 +1,189 @@
+from random import uniform as _uniform
+from threading import Lock as _Lock
+from time import perf_counter as _perf_counter
+from time import sleep as _sleep
+from requests import Session as _Session
+from requests.adapters import HTTPAdapter as _HTTPAdapter
+from requests.exceptions import ConnectionError as _ConnectionError
+from requests.exceptions import Timeout as _Timeout
+from .metrics import endpointOf as _endpointOf
+from .ratelimit import RateLimiter as _RateLimiter
+from .errors import RequestFailed as _RequestFailed
+from .errors import RateLimited as _RateLimited
+
+
+class Transport(object):
+    '''
+    Sends requests to Steam on behalf of a :class:`steamfront.client.Client`, and the objects it makes.
+    Every bit of network access goes through here, so the objects themselves can be built from data that's already been retrieved.
+
+    All requests share one pooled session, so connections are kept alive between them. Requests are held back to stay under Steam's rate limits,
+    and those that fail because of throttling, server errors, or connection problems are retried with jittered exponential backoff.
+
+    :param int poolSize: The largest number of connections to keep open to each host.
+    :param float timeout: How long, in seconds, a request can take before it's given up on.
+    :param int retries: How many times a failed request is retried before giving up.
+    :param float backoff: The base delay, in seconds, between retries. This doubles with each attempt.
+    :param float maxBackoff: The longest delay, in seconds, between retries.
+    :param rateLimits: A `dict` of URL prefix to `(calls, period)` tuples. Defaults to :attr:`RATE_LIMITS`. Pass an empty `dict` to turn off rate limiting.
+    :type rateLimits: Optional[dict]
+    :ivar session: The :class:`requests.Session` all requests are made through.
+    :ivar metrics: The :class:`steamfront.metrics.Metrics` that requests are recorded in, or `None`.
+    :ivar hooks: A `dict` of lists of functions to call around each attempt at a request. Those under `request` are given the URL before it's sent, and those under `response` are given the URL, the status code (or `None` if there was no response), and how many seconds it took.
+    '''
+
+    RATE_LIMITS = {
+        'store.steampowered.com/api/appdetails': (200, 300),
+        'api.steampowered.com': (100000, 86400),
+    }
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+    _default = None
+    _defaultLock = _Lock()
+
+    def __init__(self, *, poolSize: int=10, timeout: float=30, retries: int=3, backoff: float=1, maxBackoff: float=60, rateLimits: dict=None):
+
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self._limiter = _RateLimiter(Transport.RATE_LIMITS if rateLimits is None else rateLimits)
+        self.metrics = None
+        self.hooks = {'request': [], 'response': []}
+
+        # Make the shared session
+        self.session = _Session()
+        adapter = _HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @classmethod
+    def default(cls):
+        '''
+        Gives the transport shared by objects that are made without one.
+
+        :rtype: :class:`steamfront.transport.Transport`
+        '''
+
+        with cls._defaultLock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _delay(self, attempt: int, retryAfter: float=None) -> float:
+        '''
+        Gives how long to wait before the next attempt at a request.
+        '''
+
+        delay = _uniform(0, min(self.maxBackoff, self.backoff * 2 ** attempt))
+        if retryAfter is not None:
+            delay = max(delay, min(self.maxBackoff, retryAfter))
+        return delay
+
+    def _record(self, url: str, endpoint: str, status: int, size: int, seconds: float, timed: bool=True):
+        '''
+        Tells the metrics and hooks about an attempt at a request. Streamed responses aren't `timed` here, as their time is only known once the body has been read.
+        '''
+
+        if self.metrics is not None:
+            self.metrics.recordRequest(endpoint, 'error' if status is None else status, size)
+            if timed:
+                self.metrics.observe('network', endpoint, seconds)
+        for hook in self.hooks['response']:
+            hook(url, status, seconds)
+
+    def request(self, url: str, **kwargs):
+        '''
+        Makes a GET request, retrying it if needed.
+
+        :param str url: The URL to get.
+        :return: The successful response.
+        :rtype: :class:`requests.Response`
+        :raises steamfront.errors.RateLimited: Raised if Steam was still throttling requests after every retry.
+        :raises steamfront.errors.RequestFailed: Raised if the request couldn't be made successfully.
+        '''
+
+        endpoint = _endpointOf(url)
+        for attempt in range(self.retries + 1):
+            self._limiter.acquire(url)
+            retryAfter = None
+            if attempt and self.metrics is not None:
+                self.metrics.recordRetry(endpoint)
+            for hook in self.hooks['request']:
+                hook(url)
+
+            start = _perf_counter()
+            try:
+                site = self.session.get(url, timeout=self.timeout, **kwargs)
+            except (_ConnectionError, _Timeout) as e:
+                self._record(url, endpoint, None, 0, _perf_counter() - start)
+                error = _RequestFailed('The request to Steam could not be made: {}'.format(e))
+            else:
+                streamed = kwargs.get('stream') and site.status_code < 400
+                size = 0 if kwargs.get('stream') else len(site.content)
+                self._record(url, endpoint, site.status_code, size, _perf_counter() - start, not streamed)
+                if site.status_code < 400:
+                    return site
+
+                # Give the connection back to the pool, since a streamed body is never going to be read
+                site.close()
+                if site.status_code not in Transport.RETRY_STATUSES:
+                    raise _RequestFailed('Steam responded with status {}.'.format(site.status_code))
+
+                if site.status_code == 429:
+                    error = _RateLimited('Steam is rate limiting requests.')
+                else:
+                    error = _RequestFailed('Steam responded with status {}.'.format(site.status_code))
+                try:
+                    retryAfter = float(site.headers.get('Retry-After'))
+                except (TypeError, ValueError):
+                    pass
+
+            if attempt < self.retries:
+                _sleep(self._delay(attempt, retryAfter))
+        raise error
+
+    def getJSON(self, url: str):
+        '''
+        Gives the decoded JSON body of the given URL.
+
+        :param str url: The URL to get.
+        :return: The decoded body of the response.
+        '''
+
+        site = self.request(url)
+        if self.metrics is None:
+            return site.json()
+        with self.metrics.timer('decode', _endpointOf(url)):
+            return site.json()
+
+    def stream(self, url: str, *, chunkSize: int=65536):
+        '''
+        Gives the body of the given URL in chunks as it arrives, rather than all at once.
+
+        :param str url: The URL to get.
+        :param int chunkSize: The most bytes in each chunk.
+        :return: A generator of chunks of the body.
+        :rtype: Iterator[bytes]
+        '''
+
+        site = self.request(url, stream=True)
+        endpoint = _endpointOf(url)
+
+        # The network time is the wait for the headers and for every chunk, leaving out whatever is done with each chunk in between
+        seconds = site.elapsed.total_seconds()
+        try:
+            chunks = site.iter_content(chunkSize)
+            while True:
+                start = _perf_counter()
+                chunk = next(chunks, None)
+                seconds += _perf_counter() - start
+                if chunk is None:
+                    break
+                if self.metrics is not None:
+                    self.metrics.recordBytes(endpoint, len(chunk))
+                yield chunk
+        finally:
+            site.close()
+            if self.metrics is not None:
+                self.metrics.observe('network', endpoint, seconds)
@@ -1,4 +1,6 @@
-from requests import get as _get
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from concurrent.futures import as_completed as _as_completed
+from .transport import Transport as _Transport
 from .errors import UserNotFound as _UserNotFound
 from .errors import APIKeyRequired as _APIKeyRequired
 from .userapp import UserApp as _UserApp
@@ -11,6 +13,7 @@ class User(object):
     :param str id64: The user's ID64.
     :param apiKey: Your API key.
     :type apiKey: Optional[str]
+    :param transport: The :class:`steamfront.transport.Transport` to get the user through. A shared default one is used if none is given.
     :ivar raw: The raw `dict` that was retrieved from the API.
     :ivar id64: A `str` containing the user's ID64 value.
     :ivar name: A `str` of the user's display name on Steam.
@@ -22,23 +25,25 @@ class User(object):
     :ivar raw_games: The raw `dict` of what was retrieved from the API.
     :ivar game_count: An `int` showing how many games are on the user's profile.
     :ivar games: A `list` of `str` containing the app IDs of the user's games.
+    :ivar apps: A `list` of :class:`steamfront.userapp.UserApp` for each of the user's games, or `None` if the user was got without them.
     :raises steamfront.errors.APIKeyRequired: An API key is needed to get user information from Steam.
     :raises steamfront.errors.UserNotFound: Raised if the user's ID64 is not able to be found on Steam.
     '''
 
     getUser = 'http://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/?key={key}&steamids={id64}'
     userGames = 'http://api.steampowered.com/IPlayerService/GetOwnedGames/v0001/?key={key}&steamid={id64}'
+    resolveName = 'http://api.steampowered.com/ISteamUser/ResolveVanityURL/v0001/?key={key}&vanityurl={name}'
+
+    def __init__(self, id64: str, apiKey: str=None, *, transport: _Transport=None):
 
-    def __init__(self, id64: str, apiKey: str=None):
-        
         # You need an API key to get any user data
         if apiKey == None:
             raise _APIKeyRequired('An API key is required to get user information from the Steam API.')
 
         # Get the website data
+        transport = transport or _Transport.default()
         siteurl = User.getUser.format(id64=id64, key=apiKey)
-        site = _get(siteurl)
-        rawdata = site.json()
+        rawdata = transport.getJSON(siteurl)
 
         # Start to parse
         try:
@@ -46,6 +51,35 @@ class User(object):
         except IndexError:
             raise _UserNotFound('The specified user could not be found.')
 
+        # Get the website data for games
+        siteurl = User.userGames.format(id64=id64, key=apiKey)
+        rawdata = transport.getJSON(siteurl)
+        self._client = None
+        self._load(userdata, rawdata['response'])
+
+    @classmethod
+    def fromPayload(cls, summary: dict, ownedGames: dict, *, client=None):
+        '''
+        Makes a user object from data that's already been retrieved from the API, without making any requests.
+
+        :param dict summary: The user's entry in the `players` list of a GetPlayerSummaries response.
+        :param ownedGames: The `response` of a GetOwnedGames request for the user, or `None` to leave the user's apps out.
+        :type ownedGames: Optional[dict]
+        :param client: The :class:`steamfront.client.Client` that the user's apps should be retrieved through when they're unlazified.
+        :return: The object of relevant data on the user.
+        :rtype: :class:`steamfront.user.User`
+        '''
+
+        user = cls.__new__(cls)
+        user._client = client
+        user._load(summary, ownedGames)
+        return user
+
+    def _load(self, userdata: dict, gamedata: dict):
+        '''
+        Stores the attributes of the user from their player summary and the `response` of their owned games.
+        '''
+
         # Parse and store
         self.raw = userdata
         self.id64 = userdata['steamid']
@@ -67,12 +101,63 @@ class User(object):
         }[userdata['communityvisibilitystate']]
         self.last_online = userdata['lastlogoff']
 
-        # Get the website data for games
-        siteurl = User.userGames.format(id64=id64, key=apiKey)
-        site = _get(siteurl)
-        rawdata = site.json()
-        gamedata = rawdata['response']['games']
+        if gamedata is None:
+            self.raw_apps = self.app_count = self.apps = None
+            return
+
+        self.raw_apps = gamedata['games']
+        self.app_count = gamedata['game_count']
+        self.apps = [_UserApp(i, self) for i in self.raw_apps] # playtime_forever
+
+    def iterApps(self):
+        '''
+        Gives each of the user's apps straight from the API, one at a time as their list is downloaded.
+        None of them are kept by the user, so even very large libraries can be gone through without holding them all in memory.
+        Only works for users that were got through a :class:`steamfront.client.Client`.
+
+        :return: A generator of lazy :class:`steamfront.userapp.UserApp`.
+        :rtype: Iterator[steamfront.userapp.UserApp]
+        '''
+
+        if self._client is None:
+            raise ValueError('Apps can only be streamed for users that were got through a client.')
+        for i in self._client._iterOwnedGames(self.id64):
+            yield _UserApp(i, self)
+
+    def loadApps(self, appids=None, *, concurrency: int=8, progress=None) -> dict:
+        '''
+        Unlazifies many of the user's apps at once, getting them concurrently. An app that fails to load won't stop the others from loading, and will stay lazy.
+        Apps that have already been loaded through the user's client, such as through another user's library, aren't requested again.
+
+        :param appids: The IDs of the apps to load. Defaults to all of the user's apps that are still lazy.
+        :type appids: Optional[Iterable[str]]
+        :param int concurrency: The most apps to be getting at once.
+        :param progress: A function to be called after each app is done with, given the number of apps done, the total number of apps, the :class:`steamfront.userapp.UserApp`, and the exception raised for it or `None`.
+        :type progress: Optional[Callable]
+        :return: A `dict` of the ID of each app that couldn't be loaded to the exception raised for it.
+        :rtype: dict
+        :raises ValueError: Raised if the user was got without their apps.
+        '''
+
+        if self.apps is None:
+            raise ValueError('The user was got without their apps, so there are none to load. Get them with `apps=True`, or go through them with `iterApps`.')
+
+        wanted = None if appids is None else {str(i) for i in appids}
+        pending = [i for i in self.apps if i.lazy and (wanted is None or str(i.appid) in wanted)]
+
+        def load(app):
+            app._getApp()
+            app.lazy = False
 
-        self.raw_apps = gamedata
-        self.app_count = rawdata['response']['game_count']
-        self.apps = [_UserApp(i, self) for i in gamedata] # playtime_forever
+        # Run through each of the apps
+        failed = {}
+        with _ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            futures = {pool.submit(load, i): i for i in pending}
+            for done, future in enumerate(_as_completed(futures), 1):
+                app = futures[future]
+                error = future.exception()
+                if error is not None:
+                    failed[str(app.appid)] = error
+                if progress is not None:
+                    progress(done, len(pending), app, error)
+        return failed
@@ -15,21 +15,43 @@ class UserApp(_App):
     :ivar lazy: A `bool` representing whether or not the object has all of its aspects from :class:`steamfront.app.App`.
     '''
 
+    __slots__ = ('play_time', 'player_id', 'player', 'lazy')
+
     def __init__(self, appdata:dict, user, lazy=True):
 
+        self._fields = {}
         self.appid = str(appdata['appid'])
         self.play_time = appdata['playtime_forever']
         self.player_id = user.id64
         self.player = user
 
         if lazy == False:
-            super().__init__(self.appid)
+            self._getApp()
         self.lazy = lazy
 
+    def _getApp(self):
+        '''
+        Gets the app's data, through the user's client if they have one.
+        '''
+
+        appid = str(self.appid)
+        client = self.player._client
+        if client is None:
+            super().__init__(appid)
+            return
+
+        # Use an app that's already been loaded through the client if there is one
+        loaded = client._loadedApps.get(appid)
+        if loaded is not None:
+            self._load({'success': True, 'data': loaded.raw})
+        else:
+            self._load(client._getAppPayload(appid))
+        client._loadedApps[appid] = self
+
     def unlazify(self):
         '''
         To get all of the app attributes of an app, this must be called.
         '''
 
         self.lazy = False 
-        super().__init__(self.appid)
+        self._getApp()
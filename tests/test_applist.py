@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+from steamfront.applist import AppList
+
+
+# Duplicates, names that only differ by case, names that casefold to something longer, and characters that take more than one byte
+APPS = [
+    {'appid': 10, 'name': 'Counter-Strike'},
+    {'appid': 20, 'name': 'Team Fortress Classic'},
+    {'appid': 30, 'name': 'Day of Defeat'},
+    {'appid': 5, 'name': 'Day of Defeat'},
+    {'appid': 40, 'name': 'day of defeat'},
+    {'appid': 50, 'name': 'Straße'},
+    {'appid': 60, 'name': 'STRASSE'},
+    {'appid': 70, 'name': 'Café 漢字 \U0001f3ae'},
+    {'appid': 80, 'name': ''},
+    {'appid': 4294967295, 'name': 'Largest ID'},
+]
+
+
+class AppListTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'applist.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def lists(self, apps: list) -> list:
+        '''
+        Gives a list packed in memory, and the same list after being saved and loaded again.
+        '''
+
+        packed = AppList.fromApps(apps)
+        packed.save(self.path)
+        return [packed, AppList.load(self.path)]
+
+    def test_round_trip(self):
+        for apps in (APPS, [], APPS[:1]):
+            for loaded, appList in enumerate(self.lists(apps)):
+                with self.subTest(apps=len(apps), loaded=bool(loaded)):
+                    self.assertEqual(len(appList), len(apps))
+                    self.assertEqual(list(appList), [(i['appid'], i['name']) for i in apps])
+
+    def test_get_id(self):
+        for loaded, appList in enumerate(self.lists(APPS)):
+            with self.subTest(loaded=bool(loaded)):
+                self.assertEqual(appList.getID('Counter-Strike'), '10')
+                self.assertEqual(appList.getID('Café 漢字 \U0001f3ae'), '70')
+                self.assertEqual(appList.getID(''), '80')
+
+                # The first of several apps with the same name wins, whether or not case matters
+                self.assertEqual(appList.getID('Day of Defeat'), '30')
+                self.assertEqual(appList.getID('day of defeat'), '40')
+                self.assertEqual(appList.getID('DAY OF DEFEAT', False), '30')
+                self.assertEqual(appList.getID('strasse', False), '50')
+                self.assertEqual(appList.getID('STRASSE'), '60')
+
+                self.assertIsNone(appList.getID('counter-strike'))
+                self.assertIsNone(appList.getID('Half-Life'))
+                self.assertIsNone(appList.getID('Half-Life', False))
+
+    def test_get_name(self):
+        for loaded, appList in enumerate(self.lists(APPS)):
+            with self.subTest(loaded=bool(loaded)):
+                self.assertEqual(appList.getName('20'), 'Team Fortress Classic')
+                self.assertEqual(appList.getName(5), 'Day of Defeat')
+                self.assertEqual(appList.getName(4294967295), 'Largest ID')
+                self.assertEqual(appList.getName(80), '')
+                self.assertIsNone(appList.getName(11))
+                self.assertIsNone(appList.getName(0))
+
+    def test_save_replaces(self):
+        AppList.fromApps(APPS).save(self.path)
+        AppList.fromApps(APPS[:2]).save(self.path)
+        self.assertEqual(len(AppList.load(self.path)), 2)
+        self.assertEqual(os.listdir(self.directory.name), ['applist.bin'])
+
+    def test_rejects_truncated_files(self):
+        AppList.fromApps(APPS).save(self.path)
+        with open(self.path, 'rb') as a:
+            data = a.read()
+        for length in range(0, len(data)):
+            with self.subTest(length=length):
+                with open(self.path, 'wb') as a:
+                    a.write(data[:length])
+                with self.assertRaises(ValueError):
+                    AppList.load(self.path)
+
+    def test_rejects_other_files(self):
+        AppList.fromApps(APPS).save(self.path)
+        with open(self.path, 'rb') as a:
+            data = a.read()
+        for changed in (b'XXXX' + data[4:], data[:4] + b'\xff' + data[5:], b'{"applist": {"apps": []}}' + data):
+            with self.subTest(changed=changed[:8]):
+                with open(self.path, 'wb') as a:
+                    a.write(changed)
+                with self.assertRaises(ValueError):
+                    AppList.load(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import time
+import unittest
+
+from steamfront.cache import DiskBackend, MemoryBackend, ResponseCache
+
+
+class BackendTests(object):
+    '''
+    Tests that every backend has to pass. Mixed in with a test case that makes the backend.
+    '''
+
+    def makeBackend(self, **kwargs):
+        raise NotImplementedError
+
+    def test_get_set_delete(self):
+        backend = self.makeBackend()
+        self.assertIsNone(backend.get('a'))
+        backend.set('a', {'x': [1, 'two', None]}, 123.5)
+        backend.set('b', 'café', 456)
+        self.assertEqual(backend.get('a'), (123.5, {'x': [1, 'two', None]}))
+        self.assertEqual(backend.get('b'), (456, 'café'))
+        self.assertEqual(len(backend), 2)
+
+        backend.set('a', 2, 789)
+        self.assertEqual(backend.get('a'), (789, 2))
+        backend.delete('a')
+        backend.delete('missing')
+        self.assertIsNone(backend.get('a'))
+        backend.clear()
+        self.assertEqual(len(backend), 0)
+
+    def test_least_recently_used_go_first(self):
+        backend = self.makeBackend(maxEntries=3)
+        for key in 'abc':
+            backend.set(key, key, 1)
+        backend.get('a')
+        backend.set('d', 'd', 1)
+        self.assertIsNone(backend.get('b'))
+        for key in 'acd':
+            self.assertEqual(backend.get(key), (1, key))
+
+
+class MemoryBackendTest(BackendTests, unittest.TestCase):
+
+    def makeBackend(self, **kwargs):
+        return MemoryBackend(**kwargs)
+
+    def test_max_bytes(self):
+        backend = MemoryBackend(maxBytes=20)
+        backend.set('a', 'x' * 10, 1)
+        backend.set('b', 'y' * 10, 1)
+        self.assertIsNone(backend.get('a'))
+        self.assertEqual(backend.get('b'), (1, 'y' * 10))
+
+        # A value that's too big on its own is still kept, until something else comes along
+        backend.set('c', 'z' * 50, 1)
+        self.assertEqual(len(backend), 1)
+        self.assertEqual(backend.get('c'), (1, 'z' * 50))
+
+
+class DiskBackendTest(BackendTests, unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache', 'responses.sqlite')
+        self.backends = []
+        self.pruneEvery = DiskBackend.pruneEvery
+
+    def tearDown(self):
+        DiskBackend.pruneEvery = self.pruneEvery
+        for backend in self.backends:
+            backend._db.close()
+        self.directory.cleanup()
+
+    def makeBackend(self, **kwargs):
+        # Trimming happens every so often rather than on every write, so have it happen on every write here
+        DiskBackend.pruneEvery = 1
+        backend = DiskBackend(self.path, **kwargs)
+        self.backends.append(backend)
+        return backend
+
+    def test_shared_between_instances(self):
+        first = self.makeBackend()
+        second = self.makeBackend()
+        first.set('a', [1, 2], 50)
+        self.assertEqual(second.get('a'), (50, [1, 2]))
+        second.delete('a')
+        self.assertIsNone(first.get('a'))
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.get('appdetails', '10'))
+        cache.set('appdetails', '10', {'success': True})
+        self.assertEqual(cache.get('appdetails', '10'), {'success': True})
+        self.assertEqual(cache.get('summary', '10', 'default'), 'default')
+        self.assertEqual(cache.stats, {'appdetails': {'hits': 1, 'misses': 1}, 'summary': {'hits': 0, 'misses': 1}})
+
+    def test_expiry(self):
+        cache = ResponseCache(ttls={'summary': 60, 'ownedgames': 0})
+        self.assertEqual(cache.ttls['appdetails'], ResponseCache.TTLS['appdetails'])
+
+        before = time.time()
+        cache.set('summary', '1', 'fresh')
+        expires, value = cache.getEntry('summary', '1')
+        self.assertEqual(value, 'fresh')
+        self.assertGreaterEqual(expires, before + 60)
+
+        # Kinds with no time to live aren't kept at all
+        cache.set('ownedgames', '1', 'never')
+        self.assertIsNone(cache.backend.get('ownedgames:1'))
+
+        # Expired entries are misses, but getEntry still gives them back
+        cache.backend.set('summary:2', 'stale', time.time() - 1)
+        self.assertIsNone(cache.get('summary', '2'))
+        self.assertEqual(cache.getEntry('summary', '2')[1], 'stale')
+        self.assertIsNone(cache.getEntry('summary', '3'))
+        self.assertEqual(cache.stats['summary'], {'hits': 1, 'misses': 3})
+
+    def test_kinds_are_kept_apart(self):
+        cache = ResponseCache()
+        cache.set('summary', '1', 'summary')
+        cache.set('ownedgames', '1', 'games')
+        cache.delete('summary', '1')
+        self.assertIsNone(cache.get('summary', '1'))
+        self.assertEqual(cache.get('ownedgames', '1'), 'games')
+        cache.clear()
+        self.assertIsNone(cache.get('ownedgames', '1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
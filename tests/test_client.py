@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from urllib.parse import parse_qsl, urlsplit
+
+from steamfront.cache import DiskBackend, ResponseCache
+from steamfront.client import Client
+from steamfront.prefetch import PrefetchScheduler
+
+
+def _details(appid: str) -> dict:
+    return {'success': True, 'data': {'steam_appid': int(appid), 'name': 'App {}'.format(appid), 'type': 'game'}}
+
+
+class FakeTransport(object):
+    '''
+    Answers appdetails requests from memory, refusing groups of apps the way Steam does for full details.
+    '''
+
+    def __init__(self):
+        self.metrics = None
+        self.hooks = {'request': [], 'response': []}
+        self.urls = []
+
+    def getJSON(self, url: str):
+        self.urls.append(url)
+        appids = dict(parse_qsl(urlsplit(url).query))['appids'].split(',')
+        if len(appids) > 1:
+            return None
+        return {appids[0]: _details(appids[0])}
+
+
+class CacheCountTest(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = FakeTransport()
+        self.client = Client(transport=self.transport, cache=True, metrics=True)
+
+    def assertCounts(self, hits: int, misses: int):
+        self.assertEqual(self.client.cache.stats['appdetails'], {'hits': hits, 'misses': misses})
+        self.assertEqual(self.client.metrics.cache.get(('appdetails', 'hit'), 0), hits)
+        self.assertEqual(self.client.metrics.cache.get(('appdetails', 'miss'), 0), misses)
+
+    def test_get_app(self):
+        self.client.getApp(appid=10)
+        self.assertCounts(0, 1)
+        self.client.getApp(appid=10)
+        self.assertCounts(1, 1)
+        self.assertEqual(len(self.transport.urls), 1)
+
+    def test_get_apps(self):
+        apps = self.client.getApps([10, 20])
+        self.assertEqual(sorted(apps), ['10', '20'])
+        self.assertCounts(0, 2)
+        self.client.getApps([10, 20, 30])
+        self.assertCounts(2, 3)
+        self.assertEqual(len(self.transport.urls), 3)
+
+    def test_get_apps_in_groups(self):
+        # The group goes unanswered, so each app is asked for alone without being looked for in the cache again
+        apps = self.client.getApps([10, 20], batchSize=2)
+        self.assertEqual(apps['20'].name, 'App 20')
+        self.assertCounts(0, 2)
+        self.assertEqual(len(self.transport.urls), 3)
+
+    def test_disk_cache_is_shared(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'responses.sqlite')
+            backends = [DiskBackend(path), DiskBackend(path)]
+            try:
+                Client(transport=self.transport, cache=ResponseCache(backend=backends[0])).getApps([10, 20])
+                other = Client(transport=FakeTransport(), cache=ResponseCache(backend=backends[1]))
+                apps = other.getApps([10, 20])
+                self.assertEqual(apps['10'].name, 'App 10')
+                self.assertEqual(other._transport.urls, [])
+                self.assertEqual(other.cache.stats['appdetails'], {'hits': 2, 'misses': 0})
+            finally:
+                for backend in backends:
+                    backend._db.close()
+
+    def test_prefetch_counts_one_read(self):
+        prefetch = PrefetchScheduler()
+        client = Client(transport=self.transport, prefetch=prefetch)
+        try:
+            client.getApps([10])
+            self.assertEqual(prefetch._tracked[('appdetails', '10')][0], 1)
+        finally:
+            client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
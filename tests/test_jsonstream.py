@@ -0,0 +1,54 @@
+import json
+import unittest
+
+from steamfront.jsonstream import iterArray
+
+
+# Documents that are awkward to split - numbers with fractions and exponents, escapes, and characters that take more than one byte
+DOCUMENTS = [
+    ({'a': [1.5, 2, -3.25e-2, 1e3, 0, -0.0, 12345678901234567890, 6.02E+23]}, ('a',)),
+    ({'applist': {'apps': {'app': [{'appid': 10, 'name': 'Counter-Strike'}, {'appid': 20, 'name': 'Team Fortress Classic'}]}}}, ('applist', 'apps', 'app')),
+    ({'skip': {'x': [1, {'y': '}]'}], 'z': 2.5}, 'response': {'game_count': 2, 'games': [{'appid': 1, 'playtime_forever': 0.5}, 7]}}, ('response', 'games')),
+    ({'a': ['café', '漢字', '\U0001f3ae', 'quote " and \\ backslash', '\n\t', '']}, ('a',)),
+    ({'a': [True, False, None, [], {}, [[1], [2.75]], {'b': 1e-7}]}, ('a',)),
+    ({'a': []}, ('a',)),
+    ({'b': [1, 2]}, ('a',)),
+]
+
+
+def _expected(document: dict, path: tuple) -> list:
+    for key in path:
+        if key not in document:
+            return []
+        document = document[key]
+    return document
+
+
+def _chunks(body: bytes, size: int) -> list:
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class IterArrayTest(unittest.TestCase):
+
+    def test_every_chunk_size(self):
+        # Every split from one byte at a time up to the whole body at once has to give the same items as json.loads
+        for document, path in DOCUMENTS:
+            for separators in ((',', ':'), (', ', ': ')):
+                body = json.dumps(document, separators=separators, ensure_ascii=False).encode('utf-8')
+                expected = _expected(json.loads(body), path)
+                for size in range(1, len(body) + 1):
+                    with self.subTest(body=body, size=size):
+                        self.assertEqual(list(iterArray(_chunks(body, size), path)), expected)
+
+    def test_number_split_after_point_or_exponent(self):
+        self.assertEqual(list(iterArray([b'{"a":[1.', b'5, 2]}'], ('a',))), [1.5, 2])
+        self.assertEqual(list(iterArray([b'{"a":[1e', b'3, 2]}'], ('a',))), [1e3, 2])
+        self.assertEqual(list(iterArray([b'{"a":[1e', b'-', b'3]}'], ('a',))), [1e-3])
+
+    def test_invalid_document(self):
+        with self.assertRaises(ValueError):
+            list(iterArray([b'{"a":[1 2]}'], ('a',)))
+
+
+if __name__ == '__main__':
+    unittest.main()
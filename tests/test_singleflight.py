@@ -0,0 +1,75 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from steamfront.singleflight import SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def setUp(self):
+        self.flights = SingleFlight()
+        self.calls = []
+        self.release = threading.Event()
+
+    def slow(self, value):
+        # Holds the call open until every thread has asked for it
+        self.calls.append(value)
+        self.release.wait(5)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def runTogether(self, key, value, threads: int=8) -> list:
+        '''
+        Asks for the same key from several threads at once, giving back each thread's result or exception.
+        '''
+
+        ready = threading.Barrier(threads + 1)
+
+        def ask():
+            ready.wait()
+            try:
+                return self.flights.do(key, self.slow, value)
+            except Exception as e:
+                return e
+
+        # Give every thread time to start waiting on the call before letting it finish
+        with ThreadPoolExecutor(threads) as pool:
+            futures = [pool.submit(ask) for _ in range(threads)]
+            ready.wait()
+            time.sleep(0.2)
+            self.release.set()
+            return [i.result() for i in futures]
+
+    def test_shares_one_call(self):
+        results = self.runTogether('a', {'x': 1})
+        self.assertEqual(self.calls, [{'x': 1}])
+        self.assertTrue(all(i is results[0] for i in results))
+        self.assertEqual(len(self.flights), 0)
+
+    def test_shares_errors(self):
+        error = ValueError('failed')
+        results = self.runTogether('a', error)
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(all(i is error for i in results))
+        self.assertEqual(len(self.flights), 0)
+
+    def test_calls_again_once_finished(self):
+        self.release.set()
+        self.assertEqual(self.flights.do('a', self.slow, 1), 1)
+        self.assertEqual(self.flights.do('a', self.slow, 2), 2)
+        with self.assertRaises(KeyError):
+            self.flights.do('a', {}.__getitem__, 'missing')
+        self.assertEqual(self.flights.do('a', self.slow, 3), 3)
+        self.assertEqual(self.calls, [1, 2, 3])
+
+    def test_keys_are_kept_apart(self):
+        self.release.set()
+        self.assertEqual([self.flights.do(i, self.slow, i) for i in ('a', 'b', ('a',))], ['a', 'b', ('a',)])
+        self.assertEqual(self.calls, ['a', 'b', ('a',)])
+
+
+if __name__ == '__main__':
+    unittest.main()